@@ -5,13 +5,16 @@ All A2A methods are handled at POST / (root endpoint).
 """
 
 import asyncio
-import json
-from typing import Any
+import contextlib
+from typing import Any, AsyncGenerator
 
+import msgspec
+import orjson
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import ORJSONResponse
 from sse_starlette.sse import EventSourceResponse
 
+from .store import TaskStore
 from .types import (
     AgentCard,
     AgentCapabilities,
@@ -24,11 +27,36 @@ from .types import (
     JsonRpcResponse,
     ErrorCode,
 )
-from agent import validate_workout, stream_validation, WorkoutPlan
+from agent import get_life_sync_agent, validate_workout, stream_validation, WorkoutPlan
 
 
-# In-memory task store
-tasks: dict[str, Task] = {}
+# In-memory task store, bounded by LRU capacity and TTL for finished tasks
+TASK_STORE_MAXSIZE = 10_000
+TASK_TTL_SECONDS = 3600.0
+TASK_SWEEP_INTERVAL_SECONDS = 60.0
+tasks = TaskStore(maxsize=TASK_STORE_MAXSIZE, ttl_seconds=TASK_TTL_SECONDS)
+
+# Decodes a single JSON-RPC request, or the raw entries of a batch request
+REQUEST_DECODER = msgspec.json.Decoder(JsonRpcRequest | list[Any])
+
+# JSON-RPC methods answered with an SSE stream
+STREAMING_METHODS = ("tasks/sendSubscribe", "message/stream")
+
+# Model output is coalesced into SSE frames of at least this many characters,
+# or flushed after this delay so latency stays bounded
+STREAM_FLUSH_CHARS = 64
+STREAM_FLUSH_SECONDS = 0.02
+
+# Chunks read ahead from the model stream while a frame is being sent
+STREAM_QUEUE_MAXSIZE = 16
+
+# Disable proxy buffering so SSE frames reach the client as they are produced
+SSE_HEADERS = {
+    "Cache-Control": "no-cache, no-store, must-revalidate",
+    "X-Accel-Buffering": "no",
+    "Connection": "keep-alive",
+}
+SSE_PING_SECONDS = 15
 
 # Agent configuration
 AGENT_CARD = AgentCard(
@@ -56,15 +84,39 @@ AGENT_CARD = AgentCard(
     ],
 )
 
+# Immutable discovery and health payloads, built once at startup
+AGENT_CARD_DICT = AGENT_CARD.to_dict()
+ROOT_HEALTH = {"status": "healthy", "agent": "life-sync"}
+HEALTH = {"status": "healthy"}
+PING = {"status": "ok"}
+
 
 def create_a2a_app() -> FastAPI:
     """Create the FastAPI application with A2A endpoints."""
-    app = FastAPI(title="Life Sync Agent - A2A Server")
+    app = FastAPI(
+        title="Life Sync Agent - A2A Server",
+        default_response_class=ORJSONResponse,
+    )
+
+    @app.on_event("startup")
+    async def start_task_sweeper():
+        """Start the background task that expires finished tasks."""
+        app.state.task_sweeper = asyncio.create_task(sweep_expired_tasks())
+
+    @app.on_event("startup")
+    async def warm_agent():
+        """Build the agent and its boto3 client off the event loop at startup."""
+        await asyncio.to_thread(get_life_sync_agent)
+
+    @app.on_event("shutdown")
+    async def stop_task_sweeper():
+        """Stop the background task sweeper."""
+        app.state.task_sweeper.cancel()
 
     @app.get("/")
     async def root():
         """Root GET for basic health check."""
-        return {"status": "healthy", "agent": "life-sync"}
+        return ROOT_HEALTH
 
     @app.post("/")
     async def root_post(request: Request):
@@ -73,25 +125,33 @@ def create_a2a_app() -> FastAPI:
         Dispatches to the appropriate handler based on the JSON-RPC method.
         For tasks/sendSubscribe, returns an SSE streaming response.
         """
+        rpc_request: JsonRpcRequest | None = None
         try:
-            body = await request.json()
-            rpc_request = JsonRpcRequest.from_dict(body)
+            body = REQUEST_DECODER.decode(await request.body())
+
+            # Handle JSON-RPC batch requests
+            if isinstance(body, list):
+                return await handle_rpc_batch(body)
+
+            rpc_request = body
 
             # Handle streaming requests
-            if rpc_request.method in ("tasks/sendSubscribe", "message/stream"):
+            if rpc_request.method in STREAMING_METHODS:
                 return EventSourceResponse(
                     stream_task(rpc_request),
                     media_type="text/event-stream",
+                    headers=SSE_HEADERS,
+                    ping=SSE_PING_SECONDS,
                 )
 
             # Handle non-streaming requests
             response = await handle_rpc_request(rpc_request)
-            return JSONResponse(content=response.to_dict())
+            return ORJSONResponse(content=response.to_dict())
         except Exception as e:
-            return JSONResponse(
+            return ORJSONResponse(
                 content={
                     "jsonrpc": "2.0",
-                    "id": body.get("id", "unknown") if 'body' in locals() else "unknown",
+                    "id": rpc_request.id if rpc_request else "unknown",
                     "error": {
                         "code": ErrorCode.INTERNAL_ERROR,
                         "message": str(e),
@@ -103,26 +163,33 @@ def create_a2a_app() -> FastAPI:
     @app.get("/.well-known/agent.json")
     async def get_agent_card():
         """Return the Agent Card for A2A discovery."""
-        return AGENT_CARD.to_dict()
+        return AGENT_CARD_DICT
 
     @app.get("/.well-known/agent-card.json")
     async def get_agent_card_v2():
         """Return the Agent Card at the AgentCore-expected path."""
-        return AGENT_CARD.to_dict()
+        return AGENT_CARD_DICT
 
     @app.get("/health")
     async def health_check():
         """Health check endpoint."""
-        return {"status": "healthy"}
+        return HEALTH
 
     @app.get("/ping")
     async def ping():
         """Ping endpoint for AgentCore health checks."""
-        return {"status": "ok"}
+        return PING
 
     return app
 
 
+async def sweep_expired_tasks() -> None:
+    """Periodically evict finished tasks that have outlived the TTL."""
+    while True:
+        await asyncio.sleep(TASK_SWEEP_INTERVAL_SECONDS)
+        tasks.evict_expired()
+
+
 def normalize_parts(parts: list[dict]) -> list[dict]:
     """Normalize parts from A2A v1 (kind discriminator) to internal format (type discriminator)."""
     normalized = []
@@ -180,10 +247,69 @@ async def handle_rpc_request(request: JsonRpcRequest) -> JsonRpcResponse:
     return await handler(request)
 
 
+async def handle_batch_entry(entry: Any) -> JsonRpcResponse:
+    """Handle a single entry of a JSON-RPC batch request."""
+    try:
+        rpc_request = JsonRpcRequest.from_dict(entry)
+    except msgspec.ValidationError:
+        return JsonRpcResponse(
+            jsonrpc="2.0",
+            id=entry.get("id", "unknown") if isinstance(entry, dict) else "unknown",
+            error={
+                "code": ErrorCode.INVALID_REQUEST,
+                "message": "Invalid JSON-RPC request",
+            },
+        )
+
+    # Streaming responses cannot be multiplexed into a batch
+    if rpc_request.method in STREAMING_METHODS:
+        return JsonRpcResponse(
+            jsonrpc="2.0",
+            id=rpc_request.id,
+            error={
+                "code": ErrorCode.INVALID_REQUEST,
+                "message": f"Streaming method not allowed in batch: {rpc_request.method}",
+            },
+        )
+
+    # A failing entry gets its own error so the rest of the batch still completes
+    try:
+        return await handle_rpc_request(rpc_request)
+    except Exception as e:
+        return JsonRpcResponse(
+            jsonrpc="2.0",
+            id=rpc_request.id,
+            error={
+                "code": ErrorCode.INTERNAL_ERROR,
+                "message": str(e),
+            },
+        )
+
+
+async def handle_rpc_batch(body: list[Any]) -> ORJSONResponse:
+    """Handle a JSON-RPC 2.0 batch request, running the calls concurrently."""
+    if not body:
+        return ORJSONResponse(
+            content={
+                "jsonrpc": "2.0",
+                "id": None,
+                "error": {
+                    "code": ErrorCode.INVALID_REQUEST,
+                    "message": "Empty batch request",
+                },
+            },
+        )
+
+    responses = await asyncio.gather(*(handle_batch_entry(entry) for entry in body))
+    return ORJSONResponse(content=[r.to_dict() for r in responses])
+
+
 async def handle_task_send(request: JsonRpcRequest) -> JsonRpcResponse:
     """Handle message/send or tasks/send - validate a workout plan."""
     task = extract_message_and_task(request)
     task.status = TaskStatus.WORKING
+    # Stored once; later status/result updates mutate the same object and
+    # touch the entry so its TTL counts from when the task finished
     tasks[task.id] = task
 
     # Extract workout plan or request from message
@@ -221,7 +347,7 @@ async def handle_task_send(request: JsonRpcRequest) -> JsonRpcResponse:
         # Update task
         task.status = TaskStatus.COMPLETED
         task.result = result_message
-        tasks[task.id] = task
+        tasks.touch(task.id)
 
         return JsonRpcResponse(
             jsonrpc="2.0",
@@ -229,13 +355,13 @@ async def handle_task_send(request: JsonRpcRequest) -> JsonRpcResponse:
             result={
                 "taskId": task.id,
                 "status": task.status.value,
-                "result": result_message.to_dict(),
+                "result": tasks.result_dict(task),
             },
         )
 
     except Exception as e:
         task.status = TaskStatus.FAILED
-        tasks[task.id] = task
+        tasks.touch(task.id)
 
         return JsonRpcResponse(
             jsonrpc="2.0",
@@ -268,7 +394,7 @@ async def handle_task_get(request: JsonRpcRequest) -> JsonRpcResponse:
         result={
             "taskId": task.id,
             "status": task.status.value,
-            "result": task.result.to_dict() if task.result else None,
+            "result": tasks.result_dict(task),
         },
     )
 
@@ -289,7 +415,7 @@ async def handle_task_cancel(request: JsonRpcRequest) -> JsonRpcResponse:
         )
 
     task.status = TaskStatus.CANCELED
-    tasks[task_id] = task
+    tasks.touch(task.id)
 
     return JsonRpcResponse(
         jsonrpc="2.0",
@@ -301,19 +427,95 @@ async def handle_task_cancel(request: JsonRpcRequest) -> JsonRpcResponse:
     )
 
 
-async def stream_task(request: JsonRpcRequest):
+async def coalesce_chunks(
+    chunks: AsyncGenerator[str, None],
+    min_chars: int = STREAM_FLUSH_CHARS,
+    max_delay: float = STREAM_FLUSH_SECONDS,
+) -> AsyncGenerator[str, None]:
+    """Coalesce small text chunks into larger ones.
+
+    Buffered text is flushed once it reaches min_chars, or max_delay seconds
+    after the first buffered chunk if no further input arrives in time.
+
+    The source generator is driven by a single producer task feeding a small
+    bounded queue, so every step of it runs in the same context and the
+    contextvars used by LangChain callbacks and OpenTelemetry spans stay
+    consistent. The producer also closes the source, in that same context.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue[str | None] = asyncio.Queue(maxsize=STREAM_QUEUE_MAXSIZE)
+
+    async def produce():
+        cancelled = False
+        try:
+            async for chunk in chunks:
+                await queue.put(chunk)
+        except asyncio.CancelledError:
+            # The consumer is gone, so nothing would read the sentinel
+            cancelled = True
+            raise
+        finally:
+            await chunks.aclose()
+            if not cancelled:
+                await queue.put(None)
+
+    producer = asyncio.create_task(produce())
+    buffer: list[str] = []
+    size = 0
+    deadline = 0.0
+    try:
+        while True:
+            if buffer:
+                try:
+                    chunk = await asyncio.wait_for(queue.get(), max(deadline - loop.time(), 0.0))
+                except TimeoutError:
+                    yield "".join(buffer)
+                    buffer.clear()
+                    size = 0
+                    continue
+            else:
+                chunk = await queue.get()
+            if chunk is None:
+                break
+
+            if not buffer:
+                deadline = loop.time() + max_delay
+            buffer.append(chunk)
+            size += len(chunk)
+            if size >= min_chars or loop.time() >= deadline:
+                yield "".join(buffer)
+                buffer.clear()
+                size = 0
+
+        # Re-raise an error from the source
+        await producer
+        if buffer:
+            yield "".join(buffer)
+    finally:
+        producer.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await producer
+
+
+def sse_frame(event: bytes, payload: dict[str, Any]) -> bytes:
+    """Encode a complete SSE frame as bytes.
+
+    orjson escapes newlines, so the payload always fits on one data line.
+    EventSourceResponse passes bytes through without re-encoding them.
+    """
+    return b"event: " + event + b"\ndata: " + orjson.dumps(payload) + b"\n\n"
+
+
+async def stream_task(request: JsonRpcRequest) -> AsyncGenerator[bytes, None]:
     """Stream task execution via SSE."""
     task = extract_message_and_task(request)
 
     # Send initial status
-    yield {
-        "event": "task-status",
-        "data": json.dumps({
-            "taskId": task.id,
-            "status": TaskStatus.WORKING.value,
-            "message": "Checking constraints...",
-        }),
-    }
+    yield sse_frame(b"task-status", {
+        "taskId": task.id,
+        "status": TaskStatus.WORKING.value,
+        "message": "Checking constraints...",
+    })
 
     message_text = task.message.get_text()
     workout_plan = None
@@ -323,46 +525,34 @@ async def stream_task(request: JsonRpcRequest):
             workout_plan = WorkoutPlan.from_dict(part.data["workout"])
 
     # Send progress update
-    yield {
-        "event": "task-status",
-        "data": json.dumps({
-            "taskId": task.id,
-            "status": TaskStatus.WORKING.value,
-            "message": "Checking calendar and equipment...",
-        }),
-    }
+    yield sse_frame(b"task-status", {
+        "taskId": task.id,
+        "status": TaskStatus.WORKING.value,
+        "message": "Checking calendar and equipment...",
+    })
 
     try:
         full_content = ""
-        async for chunk in stream_validation(workout_plan, message_text):
+        async for chunk in coalesce_chunks(stream_validation(workout_plan, message_text)):
             full_content += chunk
-            yield {
-                "event": "task-chunk",
-                "data": json.dumps({
-                    "taskId": task.id,
-                    "chunk": chunk,
-                }),
-            }
+            yield sse_frame(b"task-chunk", {
+                "taskId": task.id,
+                "chunk": chunk,
+            })
 
         # Send final result
-        yield {
-            "event": "task-result",
-            "data": json.dumps({
-                "taskId": task.id,
-                "status": TaskStatus.COMPLETED.value,
-                "result": {
-                    "role": "assistant",
-                    "parts": [{"type": "text", "text": full_content}],
-                },
-            }),
-        }
+        yield sse_frame(b"task-result", {
+            "taskId": task.id,
+            "status": TaskStatus.COMPLETED.value,
+            "result": {
+                "role": "assistant",
+                "parts": [{"type": "text", "text": full_content}],
+            },
+        })
 
     except Exception as e:
-        yield {
-            "event": "task-error",
-            "data": json.dumps({
-                "taskId": task.id,
-                "status": TaskStatus.FAILED.value,
-                "error": str(e),
-            }),
-        }
+        yield sse_frame(b"task-error", {
+            "taskId": task.id,
+            "status": TaskStatus.FAILED.value,
+            "error": str(e),
+        })
@@ -0,0 +1,118 @@
+"""Bounded in-memory task store.
+
+Keeps the most recently used tasks up to a fixed capacity and expires
+finished tasks after a time-to-live, so memory stays bounded under load.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from typing import Any
+
+from .types import TERMINAL_STATUSES, Task, TaskStatus
+
+
+class _Entry:
+    """A stored task with its bookkeeping."""
+
+    __slots__ = ("task", "updated_at", "result", "result_status")
+
+    def __init__(self, task: Task, updated_at: float):
+        self.task = task
+        self.updated_at = updated_at
+        # Serialized result and the status it was serialized at
+        self.result: dict[str, Any] | None = None
+        self.result_status: TaskStatus | None = None
+
+
+class TaskStore:
+    """LRU-bounded task store with TTL expiry for finished tasks.
+
+    Supports the subset of the dict interface used by the server
+    (item assignment, ``get``, ``in`` and ``len``).
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl_seconds: float = 3600.0):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __setitem__(self, task_id: str, task: Task) -> None:
+        with self._lock:
+            self._entries[task_id] = _Entry(task, time.monotonic())
+            self._entries.move_to_end(task_id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def __getitem__(self, task_id: str) -> Task:
+        task = self.get(task_id)
+        if task is None:
+            raise KeyError(task_id)
+        return task
+
+    def __contains__(self, task_id: object) -> bool:
+        with self._lock:
+            return task_id in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, task_id: str | None, default: Task | None = None) -> Task | None:
+        """Return the task for task_id, marking it as recently used."""
+        with self._lock:
+            entry = self._entries.get(task_id)
+            if entry is None:
+                return default
+            self._entries.move_to_end(task_id)
+            return entry.task
+
+    def touch(self, task_id: str) -> None:
+        """Record that a task just changed, restarting its TTL.
+
+        Call this when a task reaches a terminal status, so the TTL counts
+        from when it finished rather than from when it was stored.
+        """
+        with self._lock:
+            entry = self._entries.get(task_id)
+            if entry is not None:
+                entry.updated_at = time.monotonic()
+                self._entries.move_to_end(task_id)
+
+    def result_dict(self, task: Task) -> dict[str, Any] | None:
+        """Serialize the task's result, memoizing it once the task has finished.
+
+        The memo is tied to the status it was taken at, so a task whose status
+        changes again is serialized afresh.
+        """
+        if task.result is None:
+            return None
+        with self._lock:
+            entry = self._entries.get(task.id)
+            if entry is None or entry.task is not task:
+                entry = None
+            elif entry.result_status is task.status:
+                return entry.result
+
+        status = task.status
+        result = task.result.to_dict()
+        if entry is not None and status in TERMINAL_STATUSES:
+            with self._lock:
+                entry.result = result
+                entry.result_status = status
+        return result
+
+    def evict_expired(self) -> int:
+        """Remove finished tasks older than the TTL. Returns the number evicted."""
+        cutoff = time.monotonic() - self.ttl_seconds
+        with self._lock:
+            expired = [
+                task_id
+                for task_id, entry in self._entries.items()
+                if entry.updated_at < cutoff and entry.task.status in TERMINAL_STATUSES
+            ]
+            for task_id in expired:
+                del self._entries[task_id]
+        return len(expired)
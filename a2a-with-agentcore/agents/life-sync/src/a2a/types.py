@@ -1,13 +1,17 @@
 """A2A Protocol Type Definitions.
 
 Implements the Google A2A (Agent-to-Agent) protocol types for
-JSON-RPC based agent communication.
+JSON-RPC based agent communication. Message and JSON-RPC envelope types
+are msgspec Structs so request bodies are validated and constructed in
+a single C-level pass.
 """
 
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
+import msgspec
+
 
 class TaskStatus(str, Enum):
     """Task execution status."""
@@ -18,8 +22,15 @@ class TaskStatus(str, Enum):
     CANCELED = "canceled"
 
 
-@dataclass
-class MessagePart:
+# Statuses after which a task no longer changes
+TERMINAL_STATUSES = frozenset({
+    TaskStatus.COMPLETED,
+    TaskStatus.FAILED,
+    TaskStatus.CANCELED,
+})
+
+
+class MessagePart(msgspec.Struct):
     """A part of a message (text or data)."""
     type: str  # "text" or "data"
     text: str | None = None
@@ -35,18 +46,13 @@ class MessagePart:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "MessagePart":
-        return cls(
-            type=data["type"],
-            text=data.get("text"),
-            data=data.get("data"),
-        )
+        return msgspec.convert(data, cls)
 
 
-@dataclass
-class Message:
+class Message(msgspec.Struct):
     """A message in the A2A protocol."""
     role: str  # "user" or "assistant"
-    parts: list[MessagePart] = field(default_factory=list)
+    parts: list[MessagePart] = []
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -56,18 +62,14 @@ class Message:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Message":
-        return cls(
-            role=data["role"],
-            parts=[MessagePart.from_dict(p) for p in data.get("parts", [])],
-        )
+        return msgspec.convert(data, cls)
 
     def get_text(self) -> str:
         """Extract all text parts concatenated."""
         return " ".join(p.text for p in self.parts if p.text)
 
 
-@dataclass
-class Task:
+class Task(msgspec.Struct):
     """A task in the A2A protocol."""
     id: str
     message: Message
@@ -86,37 +88,25 @@ class Task:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Task":
-        return cls(
-            id=data["id"],
-            message=Message.from_dict(data["message"]),
-            status=TaskStatus(data.get("status", "pending")),
-            result=Message.from_dict(data["result"]) if data.get("result") else None,
-        )
+        return msgspec.convert(data, cls)
 
 
-@dataclass
-class JsonRpcRequest:
+class JsonRpcRequest(msgspec.Struct, kw_only=True):
     """JSON-RPC 2.0 request."""
-    jsonrpc: str
-    id: str
+    jsonrpc: str = "2.0"
+    id: str | int | None = None
     method: str
-    params: dict[str, Any] = field(default_factory=dict)
+    params: dict[str, Any] = {}
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "JsonRpcRequest":
-        return cls(
-            jsonrpc=data.get("jsonrpc", "2.0"),
-            id=data["id"],
-            method=data["method"],
-            params=data.get("params", {}),
-        )
+        return msgspec.convert(data, cls)
 
 
-@dataclass
-class JsonRpcResponse:
+class JsonRpcResponse(msgspec.Struct):
     """JSON-RPC 2.0 response."""
     jsonrpc: str
-    id: str
+    id: str | int | None
     result: dict[str, Any] | None = None
     error: dict[str, Any] | None = None
 
@@ -132,7 +122,7 @@ class JsonRpcResponse:
         return response
 
 
-@dataclass
+@dataclass(slots=True)
 class JsonRpcError:
     """JSON-RPC 2.0 error."""
     code: int
@@ -162,7 +152,7 @@ class ErrorCode:
     TASK_CANCELED = -32002
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AgentSkill:
     """A skill that an agent can perform."""
     id: str
@@ -177,7 +167,7 @@ class AgentSkill:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AgentCapabilities:
     """Capabilities of an agent."""
     streaming: bool = True
@@ -190,7 +180,7 @@ class AgentCapabilities:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AgentCard:
     """Agent Card for A2A discovery."""
     name: str
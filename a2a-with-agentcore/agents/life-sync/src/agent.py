@@ -4,15 +4,30 @@ A pragmatic logistics and lifestyle coordinator that validates
 workout plans against real-world constraints.
 """
 
-import json
+import functools
+import itertools
+import os
 from dataclasses import dataclass
 from typing import Any, AsyncGenerator
 
+import orjson
 from langchain_aws import ChatBedrockConverse
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 from langgraph.prebuilt import create_react_agent
 
-from tools import get_calendar_availability, get_equipment_inventory, check_equipment_for_workout
+from tools import (
+    get_calendar_availability,
+    get_equipment_inventory,
+    check_equipment_for_workout,
+    get_calendar_availability_impl,
+    check_workout_feasibility,
+)
+
+MODEL_ID = os.environ.get("MODEL_ID", "us.amazon.nova-lite-v1:0")
+AWS_REGION = os.environ.get("AWS_REGION", "us-east-1")
+
+# Keywords that signal a conflict when the response has no structured analysis
+CONFLICT_WORDS = ("conflict", "missing", "unavailable", "no time", "limited")
 
 SYSTEM_PROMPT = """You are a pragmatic logistics and lifestyle coordinator.
 
@@ -52,8 +67,8 @@ Tone: Empathetic, realistic, and brief."""
 def create_life_sync_agent():
     """Create the Life Sync LangGraph agent."""
     model = ChatBedrockConverse(
-        model=os.environ.get("MODEL_ID", "us.amazon.nova-lite-v1:0"),
-        region_name=os.environ.get("AWS_REGION", "us-east-1"),
+        model=MODEL_ID,
+        region_name=AWS_REGION,
         max_tokens=2000,
         temperature=0.3,
     )
@@ -72,7 +87,56 @@ def create_life_sync_agent():
     return agent
 
 
-import os
+@functools.lru_cache(maxsize=1)
+def get_life_sync_agent():
+    """Return the shared Life Sync agent, creating it on first use.
+
+    The compiled graph holds no per-invocation state, so a single
+    instance is reused across requests.
+    """
+    return create_life_sync_agent()
+
+
+def find_json_object(text: str, key: str) -> dict[str, Any] | None:
+    """Find the first top-level JSON object in text that contains key.
+
+    Scans once, tracking brace depth outside of string literals, and only
+    parses balanced candidate spans that mention the key.
+    """
+    needle = f'"{key}"'
+    start = -1
+    depth = 0
+    in_string = False
+    escaped = False
+
+    for i, char in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            if depth:
+                in_string = True
+        elif char == "{":
+            if depth == 0:
+                start = i
+            depth += 1
+        elif char == "}" and depth:
+            depth -= 1
+            if depth == 0:
+                candidate = text[start:i + 1]
+                if needle in candidate:
+                    try:
+                        parsed = orjson.loads(candidate)
+                    except orjson.JSONDecodeError:
+                        continue
+                    if isinstance(parsed, dict) and key in parsed:
+                        return parsed
+
+    return None
 
 
 @dataclass
@@ -125,14 +189,19 @@ async def validate_workout(
     Returns:
         ConflictAnalysis with any detected conflicts.
     """
-    agent = create_life_sync_agent()
+    agent = get_life_sync_agent()
 
     # Build the validation prompt
     if workout_plan:
-        required_equipment = set()
-        for exercise in workout_plan.exercises:
-            for eq in exercise.get("equipment", []):
-                required_equipment.add(eq)
+        required_equipment = set(itertools.chain.from_iterable(
+            exercise.get("equipment", ()) for exercise in workout_plan.exercises
+        ))
+
+        # Look up calendar and equipment constraints up front so the model can
+        # answer in a single hop instead of calling each tool in turn. Both are
+        # in-memory lookups, so they run inline rather than on worker threads
+        availability = get_calendar_availability_impl(date, workout_plan.estimated_duration)
+        feasibility = check_workout_feasibility(sorted(required_equipment), location)
 
         prompt = f"""Please validate this workout plan:
 
@@ -141,7 +210,15 @@ Duration: {workout_plan.estimated_duration} minutes
 Exercises: {len(workout_plan.exercises)} exercises
 Required Equipment: {', '.join(required_equipment) if required_equipment else 'None (bodyweight)'}
 
-1. Check if the user has {workout_plan.estimated_duration} minutes available today
+The user's constraints have already been retrieved, so there is no need to call the tools again.
+
+Calendar availability:
+{orjson.dumps(availability.to_dict()).decode()}
+
+Equipment at {location or 'home'}:
+{orjson.dumps(feasibility).decode()}
+
+1. Check if the user has {workout_plan.estimated_duration} minutes available
 2. Check if all required equipment is available at their location ({location or 'home'})
 3. Report any conflicts found
 
@@ -170,28 +247,18 @@ Return a structured analysis with hasConflicts, conflicts array, and recommendat
             )
 
     # Parse the analysis from the response
-    try:
-        json_match = None
-        # Try to find JSON in the response
-        import re
-        json_pattern = r'\{[\s\S]*"analysis"[\s\S]*\}'
-        match = re.search(json_pattern, response_text)
-        if match:
-            parsed = json.loads(match.group())
-            analysis = parsed.get("analysis", {})
-            return ConflictAnalysis(
-                has_conflicts=analysis.get("hasConflicts", False),
-                conflicts=analysis.get("conflicts", []),
-                recommendation=analysis.get("recommendation", response_text),
-            )
-    except json.JSONDecodeError:
-        pass
+    parsed = find_json_object(response_text, "analysis")
+    if parsed:
+        analysis = parsed.get("analysis", {})
+        return ConflictAnalysis(
+            has_conflicts=analysis.get("hasConflicts", False),
+            conflicts=analysis.get("conflicts", []),
+            recommendation=analysis.get("recommendation", response_text),
+        )
 
     # Fallback: Parse from text
-    has_conflicts = any(
-        word in response_text.lower()
-        for word in ["conflict", "missing", "unavailable", "no time", "limited"]
-    )
+    response_lower = response_text.lower()
+    has_conflicts = any(word in response_lower for word in CONFLICT_WORDS)
 
     return ConflictAnalysis(
         has_conflicts=has_conflicts,
@@ -208,7 +275,7 @@ async def stream_validation(
 
     Yields chunks of the validation response.
     """
-    agent = create_life_sync_agent()
+    agent = get_life_sync_agent()
 
     if workout_plan:
         prompt = f"Validate this workout: {workout_plan.name} ({workout_plan.estimated_duration} min)"
@@ -20,7 +20,7 @@ def main():
     print(f"Agent Card: http://localhost:{PORT}/.well-known/agent.json")
     print(f"Health Check: http://localhost:{PORT}/health")
 
-    uvicorn.run(app, host="0.0.0.0", port=PORT)
+    uvicorn.run(app, host="0.0.0.0", port=PORT, loop="uvloop", http="httptools")
 
 
 if __name__ == "__main__":
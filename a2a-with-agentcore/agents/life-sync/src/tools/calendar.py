@@ -3,21 +3,33 @@
 Provides simulated calendar availability data for workout scheduling.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+import functools
+import hashlib
 import random
 from typing import Any
 
+import orjson
 from langchain_core.tools import tool
 
 
-@dataclass
+def _hhmm_to_minutes(value: str) -> int:
+    """Convert an "HH:MM" time to minutes since midnight."""
+    return int(value[0:2]) * 60 + int(value[3:5])
+
+
+@dataclass(slots=True)
 class TimeSlot:
     """A time slot with availability information."""
     start: str  # ISO 8601 format
     end: str    # ISO 8601 format
     available: bool
     conflict_reason: str | None = None
+    duration_minutes: int = field(init=False)
+
+    def __post_init__(self):
+        self.duration_minutes = _hhmm_to_minutes(self.end) - _hhmm_to_minutes(self.start)
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -28,7 +40,7 @@ class TimeSlot:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class AvailabilityResult:
     """Result of a calendar availability check."""
     date: str
@@ -85,6 +97,76 @@ MOCK_SCHEDULES = {
 }
 
 
+def _scan_slots(slots: list[TimeSlot], duration_minutes: int) -> tuple[int, tuple[str, ...]]:
+    """Find the longest free run and the slots that fit a duration in one pass.
+
+    Returns the longest run of back-to-back available minutes and the
+    "start-end" ranges of available slots at least duration_minutes long.
+    """
+    max_continuous = 0
+    current_continuous = 0
+    suitable_slots = []
+
+    for slot in slots:
+        if slot.available:
+            current_continuous += slot.duration_minutes
+            if current_continuous > max_continuous:
+                max_continuous = current_continuous
+            if slot.duration_minutes >= duration_minutes:
+                suitable_slots.append(f"{slot.start}-{slot.end}")
+        else:
+            current_continuous = 0
+
+    return max_continuous, tuple(suitable_slots)
+
+
+SCHEDULE_NAMES = tuple(MOCK_SCHEDULES)
+
+
+def _schedule_for_date(date: str) -> str:
+    """Pick a mock schedule for a date.
+
+    Uses a stable digest rather than hash(), which is salted per process,
+    so every worker maps a date to the same schedule.
+    """
+    digest = hashlib.blake2b(date.encode(), digest_size=4).digest()
+    return SCHEDULE_NAMES[int.from_bytes(digest, "big") % len(SCHEDULE_NAMES)]
+
+
+# Workout durations precomputed for every schedule
+COMMON_DURATIONS = (15, 30, 45, 60, 90, 120)
+
+# The mock schedules never change, so their derived values are computed once
+SLOT_SCANS = {
+    name: {duration: _scan_slots(slots, duration) for duration in COMMON_DURATIONS}
+    for name, slots in MOCK_SCHEDULES.items()
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _compute_availability(schedule_name: str, duration_minutes: int) -> tuple[int, str]:
+    """Compute max continuous free minutes and a recommendation for a schedule.
+
+    Pure function of its arguments, so results are memoized.
+    """
+    scan = SLOT_SCANS[schedule_name].get(duration_minutes)
+    if scan is None:
+        scan = _scan_slots(MOCK_SCHEDULES[schedule_name], duration_minutes)
+    max_continuous, suitable_slots = scan
+
+    # Generate recommendation
+    if max_continuous >= duration_minutes:
+        recommendation = f"You have {len(suitable_slots)} time slot(s) available for a {duration_minutes}-minute workout: {', '.join(suitable_slots)}"
+    elif max_continuous >= 30:
+        recommendation = f"Limited availability. Maximum continuous free time is {max_continuous} minutes. Consider a shorter workout."
+    elif max_continuous >= 15:
+        recommendation = f"Very limited availability. Only {max_continuous} minutes free. Consider a quick HIIT session or reschedule."
+    else:
+        recommendation = "No significant free time available today. Consider rescheduling the workout."
+
+    return max_continuous, recommendation
+
+
 def get_calendar_availability_impl(
     date: str | None = None,
     duration_minutes: int = 60,
@@ -103,43 +185,10 @@ def get_calendar_availability_impl(
         date = datetime.now().strftime("%Y-%m-%d")
 
     # Deterministically select schedule based on date hash
-    schedule_names = list(MOCK_SCHEDULES.keys())
-    schedule_index = hash(date) % len(schedule_names)
-    schedule_name = schedule_names[schedule_index]
+    schedule_name = _schedule_for_date(date)
     slots = MOCK_SCHEDULES[schedule_name]
 
-    # Find max continuous available time
-    max_continuous = 0
-    current_continuous = 0
-
-    for slot in slots:
-        if slot.available:
-            start_time = datetime.strptime(slot.start, "%H:%M")
-            end_time = datetime.strptime(slot.end, "%H:%M")
-            slot_duration = int((end_time - start_time).total_seconds() / 60)
-            current_continuous += slot_duration
-            max_continuous = max(max_continuous, current_continuous)
-        else:
-            current_continuous = 0
-
-    # Generate recommendation
-    if max_continuous >= duration_minutes:
-        available_slots = [s for s in slots if s.available]
-        suitable_slots = []
-        for slot in available_slots:
-            start_time = datetime.strptime(slot.start, "%H:%M")
-            end_time = datetime.strptime(slot.end, "%H:%M")
-            slot_duration = int((end_time - start_time).total_seconds() / 60)
-            if slot_duration >= duration_minutes:
-                suitable_slots.append(f"{slot.start}-{slot.end}")
-
-        recommendation = f"You have {len(suitable_slots)} time slot(s) available for a {duration_minutes}-minute workout: {', '.join(suitable_slots)}"
-    elif max_continuous >= 30:
-        recommendation = f"Limited availability. Maximum continuous free time is {max_continuous} minutes. Consider a shorter workout."
-    elif max_continuous >= 15:
-        recommendation = f"Very limited availability. Only {max_continuous} minutes free. Consider a quick HIIT session or reschedule."
-    else:
-        recommendation = "No significant free time available today. Consider rescheduling the workout."
+    max_continuous, recommendation = _compute_availability(schedule_name, duration_minutes)
 
     return AvailabilityResult(
         date=date,
@@ -149,6 +198,13 @@ def get_calendar_availability_impl(
     )
 
 
+@functools.lru_cache(maxsize=256)
+def _availability_json(date: str, duration_minutes: int) -> str:
+    """Serialize the availability for a date, memoizing the JSON string."""
+    result = get_calendar_availability_impl(date, duration_minutes)
+    return orjson.dumps(result.to_dict(), option=orjson.OPT_INDENT_2).decode()
+
+
 @tool
 def get_calendar_availability(
     date: str | None = None,
@@ -166,6 +222,7 @@ def get_calendar_availability(
     Returns:
         JSON string with available time slots and a recommendation.
     """
-    import json
-    result = get_calendar_availability_impl(date, duration_minutes)
-    return json.dumps(result.to_dict(), indent=2)
+    return _availability_json(
+        date or datetime.now().strftime("%Y-%m-%d"),
+        duration_minutes,
+    )
@@ -3,13 +3,16 @@
 Provides simulated equipment availability data for workout planning.
 """
 
+import functools
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Any
 
+import orjson
 from langchain_core.tools import tool
 
 
-@dataclass
+@dataclass(slots=True)
 class EquipmentList:
     """Equipment available at a location."""
     location: str
@@ -119,6 +122,33 @@ LOCATION_EQUIPMENT = {
     },
 }
 
+# Available equipment per location as sets for constant-time membership checks
+LOCATION_EQUIPMENT_SETS: dict[str, frozenset[str]] = {
+    loc: frozenset(data["available"]) for loc, data in LOCATION_EQUIPMENT.items()
+}
+
+VALID_LOCATIONS = frozenset(LOCATION_EQUIPMENT)
+
+# Shared read-only inventory per location, built once
+LOCATION_INVENTORY: dict[str, EquipmentList] = {
+    loc: EquipmentList(location=loc, available=data["available"], missing=data["missing"])
+    for loc, data in LOCATION_EQUIPMENT.items()
+}
+
+# Normalize location names
+LOCATION_ALIASES = MappingProxyType({
+    "house": "home",
+    "apartment": "home",
+    "fitness center": "gym",
+    "fitness_center": "gym",
+    "work": "office",
+    "workplace": "office",
+    "outdoor": "park",
+    "outdoors": "park",
+    "travel": "traveling",
+    "on the road": "traveling",
+})
+
 # Default current location (can be overridden)
 CURRENT_LOCATION = "home"
 
@@ -133,35 +163,36 @@ def get_equipment_inventory_impl(
                   Defaults to current location (home).
 
     Returns:
-        EquipmentList with available and missing equipment.
+        EquipmentList with available and missing equipment. The instance is
+        shared across calls and must not be mutated.
     """
     loc = (location or CURRENT_LOCATION).lower().strip()
+    loc = LOCATION_ALIASES.get(loc, loc)
 
-    # Normalize location names
-    location_aliases = {
-        "house": "home",
-        "apartment": "home",
-        "fitness center": "gym",
-        "fitness_center": "gym",
-        "work": "office",
-        "workplace": "office",
-        "outdoor": "park",
-        "outdoors": "park",
-        "travel": "traveling",
-        "on the road": "traveling",
-    }
-    loc = location_aliases.get(loc, loc)
-
-    if loc not in LOCATION_EQUIPMENT:
+    if loc not in VALID_LOCATIONS:
         # Unknown location - assume minimal equipment (like traveling)
         loc = "traveling"
 
-    equipment = LOCATION_EQUIPMENT[loc]
-    return EquipmentList(
-        location=loc,
-        available=equipment["available"],
-        missing=equipment["missing"],
+    return LOCATION_INVENTORY[loc]
+
+
+@functools.lru_cache(maxsize=512)
+def _find_missing_equipment(
+    required_equipment: tuple[str, ...],
+    location: str | None,
+) -> tuple[str, tuple[str, ...]]:
+    """Resolve the location and list required equipment it lacks.
+
+    Keyed on the request as given so the missing items keep their original
+    order and spelling; results are memoized since the inventory is static.
+    """
+    inventory = get_equipment_inventory_impl(location)
+    available_set = LOCATION_EQUIPMENT_SETS[inventory.location]
+    missing = tuple(
+        eq for eq in required_equipment
+        if eq.lower().replace(" ", "_") not in available_set
     )
+    return inventory.location, missing
 
 
 def check_workout_feasibility(
@@ -177,14 +208,11 @@ def check_workout_feasibility(
     Returns:
         Dictionary with feasibility status and missing equipment.
     """
-    inventory = get_equipment_inventory_impl(location)
-    available_set = set(e.lower() for e in inventory.available)
-
-    missing = []
-    for eq in required_equipment:
-        eq_lower = eq.lower().replace(" ", "_")
-        if eq_lower not in available_set:
-            missing.append(eq)
+    resolved_location, missing_equipment = _find_missing_equipment(
+        tuple(required_equipment), location
+    )
+    inventory = get_equipment_inventory_impl(resolved_location)
+    missing = list(missing_equipment)
 
     return {
         "feasible": len(missing) == 0,
@@ -199,6 +227,20 @@ def check_workout_feasibility(
     }
 
 
+@functools.lru_cache(maxsize=32)
+def _equipment_json(location: str | None) -> str:
+    """Serialize the inventory for a location, memoizing the JSON string."""
+    result = get_equipment_inventory_impl(location)
+    return orjson.dumps(result.to_dict(), option=orjson.OPT_INDENT_2).decode()
+
+
+@functools.lru_cache(maxsize=512)
+def _feasibility_json(required_equipment: tuple[str, ...], location: str | None) -> str:
+    """Serialize a feasibility check, memoizing the JSON string."""
+    result = check_workout_feasibility(list(required_equipment), location)
+    return orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()
+
+
 @tool
 def get_equipment_inventory(
     location: str | None = None,
@@ -215,9 +257,7 @@ def get_equipment_inventory(
     Returns:
         JSON string with available and missing equipment at the location.
     """
-    import json
-    result = get_equipment_inventory_impl(location)
-    return json.dumps(result.to_dict(), indent=2)
+    return _equipment_json(location)
 
 
 @tool
@@ -236,6 +276,4 @@ def check_equipment_for_workout(
     Returns:
         JSON string with feasibility status and any missing equipment.
     """
-    import json
-    result = check_workout_feasibility(required_equipment, location)
-    return json.dumps(result, indent=2)
+    return _feasibility_json(tuple(required_equipment), location)
@@ -1,8 +1,19 @@
 """Life Sync Agent Tests."""
 
+import asyncio
+import os
+import sys
 import unittest
 from datetime import datetime
 
+import orjson
+
+# The server imports the agent module from src, as it does when run from there
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from src.a2a import server
+from src.a2a.store import TaskStore
+from src.a2a.types import Message, MessagePart, Task, TaskStatus
 from src.tools.calendar import get_calendar_availability_impl
 from src.tools.equipment import get_equipment_inventory_impl, check_workout_feasibility
 
@@ -121,5 +132,85 @@ class TestWorkoutFeasibility(unittest.TestCase):
         self.assertIsInstance(result["recommendation"], str)
 
 
+class TestTaskStore(unittest.TestCase):
+    """Tests for the bounded in-memory task store."""
+
+    def _task(self, task_id: str) -> Task:
+        return Task(id=task_id, message=Message(role="user"))
+
+    def test_evicts_least_recently_used(self):
+        """Should drop the least recently used task when over capacity."""
+        store = TaskStore(maxsize=2)
+        store["a"] = self._task("a")
+        store["b"] = self._task("b")
+        store.get("a")
+        store["c"] = self._task("c")
+        self.assertIn("a", store)
+        self.assertNotIn("b", store)
+        self.assertEqual(len(store), 2)
+
+    def test_expires_only_finished_tasks(self):
+        """Should expire finished tasks past the TTL and keep running ones."""
+        store = TaskStore(ttl_seconds=0)
+        store["done"] = self._task("done")
+        store["done"].status = TaskStatus.COMPLETED
+        store["running"] = self._task("running")
+        store["running"].status = TaskStatus.WORKING
+        self.assertEqual(store.evict_expired(), 1)
+        self.assertIsNone(store.get("done"))
+        self.assertIsNotNone(store.get("running"))
+
+    def test_ttl_counts_from_completion(self):
+        """Should keep a long-running task for the full TTL after it finishes."""
+        store = TaskStore(ttl_seconds=60)
+        store["long"] = self._task("long")
+        store._entries["long"].updated_at -= 120  # stored two minutes ago
+        store["long"].status = TaskStatus.COMPLETED
+        store.touch("long")
+        self.assertEqual(store.evict_expired(), 0)
+        self.assertIsNotNone(store.get("long"))
+
+    def test_memoizes_result_once_finished(self):
+        """Should reuse the serialized result of a finished task until its status changes."""
+        store = TaskStore()
+        task = self._task("t")
+        task.result = Message(role="assistant", parts=[MessagePart(type="text", text="ok")])
+        store["t"] = task
+
+        task.status = TaskStatus.WORKING
+        self.assertIsNot(store.result_dict(task), store.result_dict(task))
+
+        task.status = TaskStatus.CANCELED
+        canceled = store.result_dict(task)
+        self.assertIs(store.result_dict(task), canceled)
+
+        task.status = TaskStatus.COMPLETED
+        completed = store.result_dict(task)
+        self.assertIsNot(completed, canceled)
+        self.assertEqual(completed, {"role": "assistant", "parts": [{"type": "text", "text": "ok"}]})
+        self.assertIs(store.result_dict(task), completed)
+
+
+class TestRpcBatch(unittest.TestCase):
+    """Tests for JSON-RPC batch handling."""
+
+    def test_failing_entry_does_not_fail_batch(self):
+        """Should answer each entry, returning an error only for the one that fails."""
+        server.tasks["batch-task"] = Task(id="batch-task", message=Message(role="user"))
+        batch = [
+            {"jsonrpc": "2.0", "id": "good", "method": "tasks/get", "params": {"taskId": "batch-task"}},
+            {"jsonrpc": "2.0", "id": "bad", "method": "tasks/send", "params": {"task": {}}},
+        ]
+
+        response = asyncio.run(server.handle_rpc_batch(batch))
+
+        self.assertEqual(response.status_code, 200)
+        good, bad = orjson.loads(response.body)
+        self.assertEqual(good["id"], "good")
+        self.assertEqual(good["result"]["taskId"], "batch-task")
+        self.assertEqual(bad["id"], "bad")
+        self.assertEqual(bad["error"]["code"], server.ErrorCode.INTERNAL_ERROR)
+
+
 if __name__ == "__main__":
     unittest.main()
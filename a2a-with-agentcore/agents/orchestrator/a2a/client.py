@@ -5,13 +5,38 @@ Supports both HTTP (local) and boto3 AgentCore (deployed) modes.
 """
 
 import asyncio
+import functools
 import json
 import os
-from dataclasses import dataclass
+import random
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from typing import Any, AsyncGenerator
 
 import httpx
 
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _json_loads = json.loads
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 from .types import (
     Task,
     TaskState,
@@ -24,12 +49,93 @@ from .types import (
 )
 
 
+# Retryable pattern count above which an Aho-Corasick automaton (when
+# pyahocorasick is installed) is used instead of the regex alternation
+AHOCORASICK_MIN_PATTERNS = 10
+
+# Concurrent in-flight requests allowed per client
+MAX_IN_FLIGHT_REQUESTS = 16
+
+# Connection pool limits for the shared HTTP client
+HTTP_POOL_LIMITS = httpx.Limits(max_connections=128, max_keepalive_connections=64)
+
+# Fail fast on unreachable agents; the request timeout covers the rest
+HTTP_CONNECT_TIMEOUT_SECONDS = 5.0
+
+# Read size for streamed SSE responses
+SSE_CHUNK_SIZE = 8192
+
+# Connection-level retries (refused/reset connects) handled by the transport
+HTTP_TRANSPORT_RETRIES = 3
+
+# Worker threads for blocking boto3 AgentCore calls. Each call, including
+# reading its response body, holds one connection on one worker, so a client
+# never needs more pooled connections than there are workers
+AGENTCORE_WORKERS = 16
+AGENTCORE_MAX_POOL_CONNECTIONS = AGENTCORE_WORKERS
+
+# Pooled HTTP client shared by every A2AClient. httpx connections are bound to
+# the loop that opened them, so it is only ever used on the background client
+# loop below; callers on other loops go through run_on_client_loop.
+_shared_client: httpx.AsyncClient | None = None
+
+
+# Dedicated pool for blocking boto3 AgentCore calls, so concurrent sub-agent
+# calls do not contend with other users of the default executor
+AGENTCORE_EXECUTOR = ThreadPoolExecutor(max_workers=AGENTCORE_WORKERS, thread_name_prefix="a2a-agentcore")
+
+
+# Background event loop that owns the long-lived sub-agent clients. Callers
+# on short-lived loops (such as each Strands agent run) hand their requests
+# to it, so pooled connections survive from one run to the next.
+_client_loop: asyncio.AbstractEventLoop | None = None
+_client_loop_lock = threading.Lock()
+
+
+def get_client_loop() -> asyncio.AbstractEventLoop:
+    """Return the background loop for sub-agent calls, starting it on first use."""
+    global _client_loop
+    with _client_loop_lock:
+        if _client_loop is None or _client_loop.is_closed():
+            _client_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_client_loop.run_forever,
+                name="a2a-client-loop",
+                daemon=True,
+            ).start()
+        return _client_loop
+
+
+async def run_on_client_loop(coro):
+    """Await a coroutine on the background sub-agent loop."""
+    loop = get_client_loop()
+    if asyncio.get_running_loop() is loop:
+        return await coro
+    return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+
+
+def get_shared_http_client() -> httpx.AsyncClient:
+    """Return the pooled HTTP client, creating it on first use.
+
+    Only call this on the client loop (see run_on_client_loop).
+    """
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(
+                retries=HTTP_TRANSPORT_RETRIES,
+                limits=HTTP_POOL_LIMITS,
+            ),
+        )
+    return _shared_client
+
+
 def _is_arn(value: str) -> bool:
     """Check if a string is an AWS ARN."""
     return value.startswith("arn:aws:")
 
 
-@dataclass
+@dataclass(slots=True)
 class RetryConfig:
     """Configuration for retry behavior."""
     max_attempts: int = 3
@@ -43,6 +149,38 @@ class RetryConfig:
         "Connection refused",
         "Connection reset",
     )
+    _retryable_pattern: re.Pattern[str] = field(init=False, repr=False, compare=False)
+    _automaton: Any = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # One alternation so classifying an error is a single search;
+        # (?!) never matches, so an empty list retries nothing
+        self._retryable_pattern = re.compile(
+            "|".join(map(re.escape, self.retryable_errors)) or "(?!)"
+        )
+
+        # Large pattern sets scan in one automaton pass when available
+        self._automaton = None
+        if ahocorasick is not None and len(self.retryable_errors) >= AHOCORASICK_MIN_PATTERNS:
+            self._automaton = ahocorasick.Automaton()
+            for pattern in self.retryable_errors:
+                self._automaton.add_word(pattern, pattern)
+            self._automaton.make_automaton()
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Return the jittered delay before retrying after an attempt.
+
+        Decorrelated jitter spreads concurrent clients' retries out so
+        they do not hit a recovering agent in lockstep.
+        """
+        ceiling = self.base_delay_seconds * (self.exponential_base ** attempt) * 3
+        return min(random.uniform(self.base_delay_seconds, ceiling), self.max_delay_seconds)
+
+    def is_retryable(self, error_msg: str) -> bool:
+        """Check whether an error message matches a retryable error."""
+        if self._automaton is not None:
+            return next(self._automaton.iter(error_msg), None) is not None
+        return self._retryable_pattern.search(error_msg) is not None
 
 
 class A2AClient:
@@ -58,6 +196,7 @@ class A2AClient:
         agent_name: str,
         timeout: float = 60.0,
         retry_config: RetryConfig | None = None,
+        card_ttl: float = 300.0,
     ):
         """Initialize the A2A client.
 
@@ -66,42 +205,88 @@ class A2AClient:
             agent_name: Name of the target agent (for logging).
             timeout: Request timeout in seconds.
             retry_config: Configuration for retry behavior.
+            card_ttl: Seconds to reuse a fetched Agent Card before refetching.
         """
         self.agent_url = agent_url.rstrip("/")
         self.agent_name = agent_name
         self.timeout = timeout
+        self._http_timeout = httpx.Timeout(timeout, connect=HTTP_CONNECT_TIMEOUT_SECONDS)
         self.retry_config = retry_config or RetryConfig()
-        self._client: httpx.AsyncClient | None = None
+        self.card_ttl = card_ttl
         self._use_agentcore = _is_arn(agent_url)
         self._boto_client = None
+        self._card_cache: dict[str, Any] | None = None
+        self._card_cached_at = 0.0
+        self._card_lock = asyncio.Lock()
+        self._semaphore = asyncio.Semaphore(MAX_IN_FLIGHT_REQUESTS)
 
         if self._use_agentcore:
             # Lazy import boto3 only when needed
             import boto3
+            from botocore.config import Config
+
             region = os.getenv("AWS_REGION", "us-east-1")
-            self._boto_client = boto3.client("bedrock-agentcore", region_name=region)
+            # botocore's adaptive mode handles backoff, jitter and throttling
+            # for AgentCore calls, so they skip the Python-level retry loop
+            self._boto_client = boto3.client(
+                "bedrock-agentcore",
+                region_name=region,
+                config=Config(
+                    retries={
+                        "mode": "adaptive",
+                        "max_attempts": self.retry_config.max_attempts,
+                    },
+                    read_timeout=self.timeout,
+                    max_pool_connections=AGENTCORE_MAX_POOL_CONNECTIONS,
+                ),
+            )
 
     async def __aenter__(self) -> "A2AClient":
-        self._client = httpx.AsyncClient(timeout=self.timeout)
         return self
 
     async def __aexit__(self, *args):
-        if self._client:
-            await self._client.aclose()
+        # The pooled HTTP client is shared and outlives this A2AClient
+        pass
 
     @property
     def client(self) -> httpx.AsyncClient:
-        if self._client is None:
-            self._client = httpx.AsyncClient(timeout=self.timeout)
-        return self._client
+        return get_shared_http_client()
+
+    @staticmethod
+    async def shutdown() -> None:
+        """Close the shared HTTP client. Run this on the client loop."""
+        global _shared_client
+        client, _shared_client = _shared_client, None
+        if client is not None:
+            await client.aclose()
 
     async def get_agent_card(self) -> dict[str, Any]:
-        """Fetch the agent's Agent Card for discovery."""
-        response = await self.client.get(
-            f"{self.agent_url}/.well-known/agent.json"
+        """Fetch the agent's Agent Card for discovery.
+
+        Cards change only on deployment, so a fetched card is reused for
+        card_ttl seconds. Concurrent callers share a single refresh.
+        """
+        if self._card_is_fresh():
+            return self._card_cache
+
+        async with self._card_lock:
+            if self._card_is_fresh():
+                return self._card_cache
+
+            response = await self.client.get(
+                f"{self.agent_url}/.well-known/agent.json",
+                timeout=self._http_timeout,
+            )
+            response.raise_for_status()
+            self._card_cache = _json_loads(response.content)
+            self._card_cached_at = time.monotonic()
+            return self._card_cache
+
+    def _card_is_fresh(self) -> bool:
+        return (
+            self._card_cache is not None
+            and time.monotonic() - self._card_cached_at < self.card_ttl
         )
-        response.raise_for_status()
-        return response.json()
 
     async def send_task(
         self,
@@ -161,19 +346,25 @@ class A2AClient:
             f"{self.agent_url}/",
             json=request_body,
             headers={"Accept": "text/event-stream"},
+            timeout=self._http_timeout,
         ) as response:
             response.raise_for_status()
 
             event_type = ""
-            async for line in response.aiter_lines():
-                if not line:
-                    continue
-
-                if line.startswith("event:"):
-                    event_type = line[6:].strip()
-                elif line.startswith("data:"):
-                    data = json.loads(line[5:].strip())
-                    yield {"event": event_type, "data": data}
+            buffer = bytearray()
+            async for chunk in response.aiter_bytes(chunk_size=SSE_CHUNK_SIZE):
+                buffer += chunk
+                start = 0
+                while (end := buffer.find(b"\n", start)) != -1:
+                    line = bytes(buffer[start:end])
+                    start = end + 1
+
+                    if line.startswith(b"event:"):
+                        event_type = sys.intern(line[6:].strip().decode())
+                    elif line.startswith(b"data:"):
+                        data = _json_loads(line[5:])
+                        yield {"event": event_type, "data": data}
+                del buffer[:start]
 
     async def get_task(self, task_id: str) -> dict[str, Any]:
         """Get the status and result of a task.
@@ -191,7 +382,7 @@ class A2AClient:
             params={"id": task_id},
         )
 
-        return await self._send_request(request)
+        return await self._send_request(self._encode_request(request))
 
     async def cancel_task(self, task_id: str) -> dict[str, Any]:
         """Cancel a running task.
@@ -209,70 +400,83 @@ class A2AClient:
             params={"id": task_id},
         )
 
-        return await self._send_request(request)
+        return await self._send_request(self._encode_request(request))
 
-    async def _send_request(
-        self,
-        request: JsonRpcRequest,
-    ) -> dict[str, Any]:
-        """Send a JSON-RPC request to the agent."""
-        request_payload = {
+    @staticmethod
+    def _encode_request(request: JsonRpcRequest) -> bytes:
+        """Serialize a JSON-RPC request to the bytes sent on the wire."""
+        return _json_dumps({
             "jsonrpc": request.jsonrpc,
             "id": request.id,
             "method": request.method,
             "params": request.params,
-        }
+        })
 
-        if self._use_agentcore:
-            # Use boto3 AgentCore client
-            loop = asyncio.get_event_loop()
-            return await loop.run_in_executor(
-                None,
-                self._invoke_agentcore,
-                request_payload
-            )
-        else:
-            # Use HTTP
-            response = await self.client.post(
-                f"{self.agent_url}/",
-                json=request_payload,
-            )
-            response.raise_for_status()
-            return response.json()
-
-    def _invoke_agentcore(self, request_payload: dict[str, Any]) -> dict[str, Any]:
+    async def _send_request(
+        self,
+        payload: bytes,
+    ) -> dict[str, Any]:
+        """Send an encoded JSON-RPC request to the agent."""
+        # Bound in-flight requests so bursts queue here instead of at the agent
+        async with self._semaphore:
+            if self._use_agentcore:
+                # Use boto3 AgentCore client
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(
+                    AGENTCORE_EXECUTOR,
+                    self._invoke_agentcore,
+                    payload
+                )
+            else:
+                # Use HTTP
+                response = await self.client.post(
+                    f"{self.agent_url}/",
+                    content=payload,
+                    headers={"Content-Type": "application/json"},
+                    timeout=self._http_timeout,
+                )
+                response.raise_for_status()
+                return _json_loads(response.content)
+
+    def _invoke_agentcore(self, payload: bytes) -> dict[str, Any]:
         """Invoke AgentCore runtime synchronously (runs in executor)."""
         response = self._boto_client.invoke_agent_runtime(
             agentRuntimeArn=self.agent_url,
             qualifier="DEFAULT",
             contentType="application/json",
             accept="application/json",
-            payload=json.dumps(request_payload),
+            payload=payload,
         )
 
         # Parse response body
         response_body = response.get("response")
         if hasattr(response_body, 'read'):
-            raw = response_body.read().decode("utf-8")
+            raw = response_body.read()
         else:
-            raw = ""
-            for chunk in response_body:
-                raw += chunk.decode("utf-8") if isinstance(chunk, bytes) else chunk
+            raw = b"".join(
+                chunk if isinstance(chunk, bytes) else chunk.encode("utf-8")
+                for chunk in response_body
+            )
 
-        return json.loads(raw)
+        return _json_loads(raw)
 
     async def _send_with_retry(
         self,
         request: JsonRpcRequest,
         retry: bool = True,
     ) -> dict[str, Any]:
-        """Send a request with retry logic."""
+        """Send a request with retry logic.
+
+        AgentCore calls are sent once here; botocore retries them itself.
+        """
         last_error: Exception | None = None
-        attempts = self.retry_config.max_attempts if retry else 1
+        attempts = self.retry_config.max_attempts if retry and not self._use_agentcore else 1
+        # Encoded once and resent as-is on every attempt
+        payload = self._encode_request(request)
 
         for attempt in range(attempts):
             try:
-                result = await self._send_request(request)
+                result = await self._send_request(payload)
 
                 # Check for JSON-RPC error
                 if "error" in result:
@@ -280,17 +484,10 @@ class A2AClient:
                     error_msg = error.get("message", "Unknown error")
 
                     # Check if error is retryable
-                    is_retryable = any(
-                        re in error_msg
-                        for re in self.retry_config.retryable_errors
-                    )
+                    is_retryable = self.retry_config.is_retryable(error_msg)
 
                     if is_retryable and attempt < attempts - 1:
-                        delay = min(
-                            self.retry_config.base_delay_seconds
-                            * (self.retry_config.exponential_base ** attempt),
-                            self.retry_config.max_delay_seconds,
-                        )
+                        delay = self.retry_config.backoff_delay(attempt)
                         await asyncio.sleep(delay)
                         continue
 
@@ -306,22 +503,14 @@ class A2AClient:
             except httpx.HTTPStatusError as e:
                 last_error = e
                 if attempt < attempts - 1:
-                    delay = min(
-                        self.retry_config.base_delay_seconds
-                        * (self.retry_config.exponential_base ** attempt),
-                        self.retry_config.max_delay_seconds,
-                    )
+                    delay = self.retry_config.backoff_delay(attempt)
                     await asyncio.sleep(delay)
                     continue
 
             except httpx.ConnectError as e:
                 last_error = e
                 if attempt < attempts - 1:
-                    delay = min(
-                        self.retry_config.base_delay_seconds
-                        * (self.retry_config.exponential_base ** attempt),
-                        self.retry_config.max_delay_seconds,
-                    )
+                    delay = self.retry_config.backoff_delay(attempt)
                     await asyncio.sleep(delay)
                     continue
 
@@ -350,7 +539,32 @@ class A2AError(Exception):
         super().__init__(f"[{agent}] {message}")
 
 
-# Pre-configured clients for sub-agents
+async def fan_out(
+    requests: list[tuple[A2AClient, str, Message]],
+) -> list[dict[str, Any] | BaseException]:
+    """Send independent tasks to several agents concurrently.
+
+    Args:
+        requests: (client, task_id, message) tuples to send.
+
+    Returns:
+        Results in request order. A failed call yields its exception
+        instead of cancelling the other calls.
+
+    Example:
+        plan, analysis = await fan_out([
+            (get_biomechanics_client(), "workout-1", workout_message),
+            (get_life_sync_client(), "validate-1", validate_message),
+        ])
+    """
+    return await asyncio.gather(
+        *(client.send_task(task_id, message) for client, task_id, message in requests),
+        return_exceptions=True,
+    )
+
+
+# Pre-configured clients for sub-agents, created once and reused
+@functools.lru_cache(maxsize=1)
 def get_biomechanics_client() -> A2AClient:
     """Get A2A client for the Biomechanics Lab agent.
 
@@ -362,6 +576,7 @@ def get_biomechanics_client() -> A2AClient:
     return A2AClient(arn_or_url, "biomechanics-lab")
 
 
+@functools.lru_cache(maxsize=1)
 def get_life_sync_client() -> A2AClient:
     """Get A2A client for the Life Sync agent.
 
@@ -5,18 +5,23 @@ JSON-RPC methods: SendMessage, SendStreamingMessage, GetTask, CancelTask.
 """
 
 import asyncio
-import json
+import contextlib
+import functools
+import logging
 import os
-import re
-import traceback
+import threading
 import uuid
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncGenerator
 
+import orjson
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from sse_starlette.sse import EventSourceResponse
 
 from .auth import oauth2_middleware
+from .client import A2AClient, get_biomechanics_client, get_life_sync_client, run_on_client_loop
+from .store import TaskStore
 from .types import (
     AgentCard,
     AgentCapabilities,
@@ -37,11 +42,37 @@ from .types import (
 # Import the Strands agent
 from strands import Agent
 from strands.models import BedrockModel
-from tools import call_biomechanics_lab, call_life_sync_agent, request_workout_compromise
+from tools import (
+    call_biomechanics_lab,
+    call_life_sync_agent,
+    plan_and_validate_workout,
+    request_workout_compromise,
+)
+
+logger = logging.getLogger("orchestrator")
+
 
+# Bounded in-memory task store
+TASK_STORE_MAXSIZE = int(os.environ.get("ORCHESTRATOR_TASK_CACHE_MAX", "10000"))
+TASK_TTL_SECONDS = float(os.environ.get("ORCHESTRATOR_TASK_TTL", "3600"))
+TASK_SWEEP_INTERVAL_SECONDS = 60.0
+tasks = TaskStore(maxsize=TASK_STORE_MAXSIZE, ttl_seconds=TASK_TTL_SECONDS)
 
-# In-memory task store
-tasks: dict[str, Task] = {}
+# Dedicated pool for blocking Strands agent runs, so bursts of tasks do not
+# queue behind other users of the default executor
+AGENT_WORKERS = int(os.environ.get("ORCHESTRATOR_AGENT_WORKERS", "16"))
+AGENT_EXECUTOR = ThreadPoolExecutor(max_workers=AGENT_WORKERS, thread_name_prefix="strands")
+
+# Set ORCHESTRATOR_SHARE_RUNS=1 to let concurrent identical messages in the
+# same context share one agent run. Off by default, since a shared run hands
+# every caller the same model reply
+SHARE_INFLIGHT_RUNS = os.environ.get("ORCHESTRATOR_SHARE_RUNS") == "1"
+
+# SSE streaming: keep-alive interval, how long a write to a stalled client
+# may block, and how many encoded events may queue ahead of the client
+SSE_PING_SECONDS = 15
+SSE_SEND_TIMEOUT_SECONDS = 30
+STREAM_QUEUE_MAXSIZE = int(os.environ.get("ORCHESTRATOR_STREAM_QUEUE_MAXSIZE", "64"))
 
 # Agent configuration
 COGNITO_DOMAIN = os.environ.get("COGNITO_DOMAIN", "")
@@ -78,19 +109,27 @@ AGENT_CARD = AgentCard(
     } if COGNITO_DOMAIN else None,
 )
 
+# Static responses, encoded once
+AGENT_CARD_BYTES = orjson.dumps(AGENT_CARD.to_dict())
+AGENT_CARD_HEADERS = {"Cache-Control": "public, max-age=60"}
+ROOT_HEALTH_BYTES = orjson.dumps({"status": "healthy", "agent": "orchestrator"})
+HEALTH_BYTES = orjson.dumps({"status": "healthy"})
+PING_BYTES = orjson.dumps({"status": "ok"})
+
 SYSTEM_PROMPT = """You are the central coordinator for a fitness multi-agent system.
 
 Objective: Translate high-level user goals into actionable workout plans and resolve
 conflicts between "ideal training" and "life reality."
 
 Your workflow:
-1. When a user requests a workout, first call the Biomechanics Lab to get the
-   physiologically optimal workout using call_biomechanics_lab.
+1. When a user requests a workout, call plan_and_validate_workout. It gets the
+   physiologically optimal workout from the Biomechanics Lab and checks calendar
+   availability and equipment with the Life Sync Agent at the same time.
    - IMPORTANT: Always provide equipment and muscle_groups as lists, use [] if none specified
-   - Example: call_biomechanics_lab(goal="upper body strength", equipment=[], muscle_groups=[], duration_minutes=60)
+   - Example: plan_and_validate_workout(goal="upper body strength", equipment=[], muscle_groups=[], duration_minutes=60)
 
-2. Once you have the workout, call the Life Sync Agent using call_life_sync_agent
-   to check calendar availability and equipment.
+2. If you need to re-check a single step, call_biomechanics_lab and
+   call_life_sync_agent remain available individually.
    - IMPORTANT: Always provide required_equipment as a list, use [] for bodyweight workouts
    - Example: call_life_sync_agent(workout_name="Upper Body", duration_minutes=60, required_equipment=[])
 
@@ -138,17 +177,76 @@ Important:
 Tone: Professional, decisive, and results-oriented."""
 
 
-def create_strands_agent() -> Agent:
-    """Create the Strands agent with A2A tools."""
-    model = BedrockModel(
-        model_id=os.environ.get("MODEL_ID", "us.amazon.nova-lite-v1:0"),
+# Models that support Bedrock latency-optimized inference
+LATENCY_OPTIMIZED_MODEL_PREFIXES = (
+    "us.anthropic.claude-3-5-haiku",
+    "us.meta.llama3-1-70b-",
+    "us.meta.llama3-1-405b-",
+    "us.amazon.nova-pro",
+)
+BEDROCK_LATENCY_MODES = ("optimized", "standard")
+
+
+def bedrock_latency_mode(model_id: str) -> str:
+    """Resolve the Bedrock latency mode for a model.
+
+    BEDROCK_PERFORMANCE_CONFIG selects "optimized" (the default) or
+    "standard"; models without latency-optimized support use "standard".
+    Any other value is logged and treated as "standard".
+    """
+    mode = os.environ.get("BEDROCK_PERFORMANCE_CONFIG", "optimized")
+    if mode not in BEDROCK_LATENCY_MODES:
+        logger.warning(
+            "Ignoring BEDROCK_PERFORMANCE_CONFIG=%r, expected one of %s; using standard",
+            mode, ", ".join(BEDROCK_LATENCY_MODES),
+        )
+        return "standard"
+    if mode == "optimized" and not model_id.startswith(LATENCY_OPTIMIZED_MODEL_PREFIXES):
+        return "standard"
+    return mode
+
+
+@functools.lru_cache(maxsize=1)
+def get_bedrock_model() -> BedrockModel:
+    """Return the shared Bedrock model, creating it on first use."""
+    model_id = os.environ.get("MODEL_ID", "us.amazon.nova-lite-v1:0")
+    latency_mode = bedrock_latency_mode(model_id)
+
+    return BedrockModel(
+        model_id=model_id,
         region_name=os.environ.get("AWS_REGION", "us-east-1"),
+        additional_args=(
+            {"performanceConfig": {"latency": latency_mode}}
+            if latency_mode != "standard" else None
+        ),
     )
 
+
+# Model families that support Bedrock prompt caching
+PROMPT_CACHE_MODEL_MARKERS = ("anthropic.claude", "amazon.nova")
+
+
+def build_system_prompt(model_id: str) -> str | list[dict[str, Any]]:
+    """Return the system prompt, marked for Bedrock prompt caching if enabled.
+
+    Set BEDROCK_PROMPT_CACHE=1 to add a cache point after the static system
+    prompt on models that support prompt caching.
+    """
+    if os.environ.get("BEDROCK_PROMPT_CACHE") == "1" and any(
+        marker in model_id for marker in PROMPT_CACHE_MODEL_MARKERS
+    ):
+        return [{"text": SYSTEM_PROMPT}, {"cachePoint": {"type": "default"}}]
+    return SYSTEM_PROMPT
+
+
+def create_strands_agent() -> Agent:
+    """Create the Strands agent with A2A tools."""
+    model = get_bedrock_model()
     agent = Agent(
         model=model,
-        system_prompt=SYSTEM_PROMPT,
+        system_prompt=build_system_prompt(model.config["model_id"]),
         tools=[
+            plan_and_validate_workout,
             call_biomechanics_lab,
             call_life_sync_agent,
             request_workout_compromise,
@@ -158,6 +256,21 @@ def create_strands_agent() -> Agent:
     return agent
 
 
+# Strands agents keep conversation history and reject concurrent calls,
+# so each worker thread reuses its own agent rather than sharing one
+_thread_agents = threading.local()
+
+
+def get_strands_agent() -> Agent:
+    """Return this thread's Strands agent with an empty conversation."""
+    agent = getattr(_thread_agents, "agent", None)
+    if agent is None:
+        agent = _thread_agents.agent = create_strands_agent()
+    else:
+        agent.messages = []
+    return agent
+
+
 def extract_message_from_params(params: dict[str, Any]) -> Message:
     """Extract Message from SendMessage/SendStreamingMessage params."""
     msg_data = params.get("message", {})
@@ -165,41 +278,174 @@ def extract_message_from_params(params: dict[str, Any]) -> Message:
     return msg
 
 
-def run_agent_and_build_result(message_text: str, task_id: str, context_id: str | None) -> tuple[list[Part], list[Artifact]]:
-    """Run the Strands agent synchronously and return parts and artifacts."""
-    agent = create_strands_agent()
-    result = agent(message_text)
-    result_text = str(result)
+def find_json_block(text: str) -> tuple[int, int] | None:
+    """Locate the JSON object in the first ```json fenced block of text.
 
+    Scans forward from the fence tracking brace depth outside of string
+    literals. Returns the (start, end) slice of the balanced object, or
+    None if there is no fenced block or it is not closed.
+    """
+    fence = text.find("```json")
+    if fence == -1:
+        return None
+    start = text.find("{", fence + 7)
+    if start == -1:
+        return None
+
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        char = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return start, i + 1
+
+    return None
+
+
+def parse_json_block(text: str) -> Any | None:
+    """Parse the JSON in the first ```json fenced block of text.
+
+    The fence grammar is fixed, so the block body is first sliced out with
+    two str.find calls and handed straight to orjson. Only when that slice
+    does not parse (e.g. a ``` inside a string value) does it fall back to
+    the brace scan in find_json_block. Returns None if no block is found;
+    raises orjson.JSONDecodeError if the block is not valid JSON.
+    """
+    fence = text.find("```json")
+    if fence == -1:
+        return None
+    body_start = fence + 7
+    body_end = text.find("```", body_start)
+    if body_end != -1:
+        try:
+            return orjson.loads(text[body_start:body_end])
+        except orjson.JSONDecodeError:
+            pass
+
+    span = find_json_block(text)
+    if span is None:
+        return None
+    return orjson.loads(text[span[0]:span[1]])
+
+
+def run_agent_sync(message_text: str) -> str:
+    """Run the Strands agent synchronously and return its reply text."""
+    agent = get_strands_agent()
+    return str(agent(message_text))
+
+
+def build_result(result_text: str) -> tuple[list[Part], list[Artifact]]:
+    """Build the reply parts and artifacts from the agent's reply text."""
     parts = [Part(kind="text", text=result_text)]
     artifacts = []
 
     # Extract structured JSON from the response
-    json_match = re.search(r'```json\s*\n?(.*?)\n?```', result_text, re.DOTALL)
-    if json_match:
-        try:
-            json_text = json_match.group(1).strip()
-            structured_data = json.loads(json_text)
+    try:
+        structured_data = parse_json_block(result_text)
+        if structured_data is not None:
             artifacts.append(Artifact(
                 name="workout-plan",
                 description="Structured workout plan",
                 parts=[Part(kind="data", data=structured_data)],
             ))
-        except json.JSONDecodeError as e:
-            print(f"JSON parsing error: {e}")
+    except orjson.JSONDecodeError as e:
+        logger.error("JSON parsing error: %s", e)
 
     return parts, artifacts
 
 
+# Agent runs in flight, keyed by (context id, message text)
+_inflight_runs: dict[tuple[str, str], asyncio.Future] = {}
+
+
+async def _run_agent(message_text: str, context_id: str) -> str:
+    """Run the agent on the agent pool.
+
+    This is the single entry point to the model for both message/send and
+    message/stream. With SHARE_INFLIGHT_RUNS on, a request that arrives
+    while an identical message in the same context is already being
+    processed awaits that run instead of starting another model call.
+    """
+    loop = asyncio.get_running_loop()
+    if not SHARE_INFLIGHT_RUNS:
+        return await loop.run_in_executor(AGENT_EXECUTOR, run_agent_sync, message_text)
+
+    key = (context_id, message_text)
+    future = _inflight_runs.get(key)
+    if future is None:
+        future = loop.run_in_executor(AGENT_EXECUTOR, run_agent_sync, message_text)
+        _inflight_runs[key] = future
+        future.add_done_callback(lambda _: _inflight_runs.pop(key, None))
+
+    return await asyncio.shield(future)
+
+
+def new_task(message: Message, state: TaskState) -> Task:
+    """Create and store a task for an incoming message."""
+    task = Task(
+        id=str(uuid.uuid4()),
+        context_id=message.context_id or str(uuid.uuid4()),
+        status=TaskStatus(state=state),
+        history=[message],
+    )
+    tasks[task.id] = task
+    return task
+
+
 def create_a2a_app() -> FastAPI:
     """Create the FastAPI application with A2A endpoints."""
     app = FastAPI(title="Orchestrator Agent - A2A Server")
     app.middleware("http")(oauth2_middleware)
 
+    @app.on_event("startup")
+    async def start_task_sweeper():
+        """Start the background task that expires finished tasks."""
+        app.state.task_sweeper = asyncio.create_task(sweep_expired_tasks())
+
+    @app.on_event("startup")
+    async def warm_model():
+        """Build the Bedrock model before the first request needs it."""
+        await asyncio.to_thread(get_bedrock_model)
+
+    @app.on_event("startup")
+    async def warm_sub_agent_clients():
+        """Create the sub-agent clients, importing boto3 when deployed, at startup."""
+        await asyncio.to_thread(get_biomechanics_client)
+        await asyncio.to_thread(get_life_sync_client)
+
+    @app.on_event("shutdown")
+    async def stop_task_sweeper():
+        """Stop the background task sweeper."""
+        app.state.task_sweeper.cancel()
+
+    @app.on_event("shutdown")
+    async def close_a2a_clients():
+        """Close the pooled HTTP client used for sub-agent calls."""
+        await run_on_client_loop(A2AClient.shutdown())
+
+    @app.on_event("shutdown")
+    async def stop_agent_executor():
+        """Stop the agent thread pool without waiting on in-flight runs."""
+        AGENT_EXECUTOR.shutdown(wait=False, cancel_futures=True)
+
     @app.get("/")
     async def root():
         """Root GET for basic health check."""
-        return {"status": "healthy", "agent": "orchestrator"}
+        return Response(content=ROOT_HEALTH_BYTES, media_type="application/json")
 
     @app.post("/")
     async def root_post(request: Request):
@@ -217,6 +463,9 @@ def create_a2a_app() -> FastAPI:
                 return EventSourceResponse(
                     stream_send_message(rpc_request),
                     media_type="text/event-stream",
+                    ping=SSE_PING_SECONDS,
+                    sep="\n",
+                    send_timeout=SSE_SEND_TIMEOUT_SECONDS,
                 )
 
             # Non-streaming methods
@@ -262,31 +511,41 @@ def create_a2a_app() -> FastAPI:
         return EventSourceResponse(
             stream_send_message(rpc_request),
             media_type="text/event-stream",
+            ping=SSE_PING_SECONDS,
+            sep="\n",
+            send_timeout=SSE_SEND_TIMEOUT_SECONDS,
         )
 
     @app.get("/.well-known/agent.json")
     async def get_agent_card():
         """Return the Agent Card for A2A discovery."""
-        return AGENT_CARD.to_dict()
+        return Response(content=AGENT_CARD_BYTES, media_type="application/json", headers=AGENT_CARD_HEADERS)
 
     @app.get("/.well-known/agent-card.json")
     async def get_agent_card_v2():
         """Return the Agent Card at the AgentCore-expected path."""
-        return AGENT_CARD.to_dict()
+        return Response(content=AGENT_CARD_BYTES, media_type="application/json", headers=AGENT_CARD_HEADERS)
 
     @app.get("/health")
     async def health_check():
         """Health check endpoint."""
-        return {"status": "healthy"}
+        return Response(content=HEALTH_BYTES, media_type="application/json")
 
     @app.get("/ping")
     async def ping():
         """Ping endpoint for AgentCore health checks."""
-        return {"status": "ok"}
+        return Response(content=PING_BYTES, media_type="application/json")
 
     return app
 
 
+async def sweep_expired_tasks() -> None:
+    """Periodically evict finished tasks that have outlived the TTL."""
+    while True:
+        await asyncio.sleep(TASK_SWEEP_INTERVAL_SECONDS)
+        tasks.evict_expired()
+
+
 async def handle_rpc_request(request: JsonRpcRequest) -> JsonRpcResponse:
     """Handle a non-streaming JSON-RPC request and return a response."""
     method_handlers = {
@@ -318,27 +577,12 @@ async def handle_rpc_request(request: JsonRpcRequest) -> JsonRpcResponse:
 
 async def handle_send_message(request: JsonRpcRequest) -> JsonRpcResponse:
     """Handle SendMessage - process a workout request and return a Task."""
-    params = request.params
-    message = extract_message_from_params(params)
-
-    task_id = str(uuid.uuid4())
-    context_id = message.context_id or str(uuid.uuid4())
-
-    task = Task(
-        id=task_id,
-        context_id=context_id,
-        status=TaskStatus(state=TaskState.WORKING),
-        history=[message],
-    )
-    tasks[task_id] = task
-
-    message_text = message.get_text()
+    message = extract_message_from_params(request.params)
+    task = new_task(message, TaskState.WORKING)
+    task_id, context_id = task.id, task.context_id
 
     try:
-        loop = asyncio.get_event_loop()
-        parts, artifacts = await loop.run_in_executor(
-            None, run_agent_and_build_result, message_text, task_id, context_id,
-        )
+        parts, artifacts = build_result(await _run_agent(message.get_text(), context_id))
 
         task.status = TaskStatus(state=TaskState.COMPLETED)
         task.artifacts = artifacts
@@ -359,9 +603,7 @@ async def handle_send_message(request: JsonRpcRequest) -> JsonRpcResponse:
     except Exception as e:
         error_type = type(e).__name__
         error_message = str(e)
-        error_tb = traceback.format_exc()
-        print(f"ERROR in orchestrator: {error_type}: {error_message}")
-        print(f"Traceback:\n{error_tb}")
+        logger.exception("Error in orchestrator: %s: %s", error_type, error_message)
 
         task.status = TaskStatus(
             state=TaskState.FAILED,
@@ -426,37 +668,79 @@ async def handle_cancel_task(request: JsonRpcRequest) -> JsonRpcResponse:
     )
 
 
-def _sse_event(request_id: str, result_obj: dict[str, Any]) -> dict[str, str]:
-    """Build an SSE event dict with a JSON-RPC response wrapping the result."""
-    return {
-        "data": json.dumps(JsonRpcResponse(
-            jsonrpc="2.0",
-            id=request_id,
-            result=result_obj,
-        ).to_dict()),
-    }
+def _sse_event(request_id: str, result_obj: dict[str, Any]) -> bytes:
+    """Encode an SSE frame whose data is a JSON-RPC response wrapping the result.
+
+    orjson escapes newlines, so the payload always fits on one data line.
+    EventSourceResponse passes bytes through without re-encoding them.
+    """
+    return b"data: " + orjson.dumps(JsonRpcResponse(
+        jsonrpc="2.0",
+        id=request_id,
+        result=result_obj,
+    ).to_dict()) + b"\n\n"
 
 
-async def stream_send_message(request: JsonRpcRequest):
-    """Stream task execution via SSE per A2A v1 spec.
+async def stream_send_message(request: JsonRpcRequest) -> AsyncGenerator[bytes, None]:
+    """Stream task events to the client as they are produced.
+
+    The task runs as its own asyncio task feeding a bounded queue, so the
+    response wakes only when an event is ready and a slow client applies
+    backpressure instead of buffering without limit. Frames that are ready
+    together, such as the initial submitted and working statuses, are sent
+    in a single write.
+    """
+    queue: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=STREAM_QUEUE_MAXSIZE)
+
+    async def produce():
+        events = task_events(request)
+        cancelled = False
+        try:
+            async for frame in events:
+                await queue.put(frame)
+        except asyncio.CancelledError:
+            # The client disconnected; nothing drains the queue, so a
+            # sentinel put could block forever on a full queue
+            cancelled = True
+            raise
+        finally:
+            await events.aclose()
+            if not cancelled:
+                await queue.put(None)
+
+    producer = asyncio.create_task(produce())
+    try:
+        done = False
+        while not done:
+            frame = await queue.get()
+            if frame is None:
+                break
+            # Send every frame that is already waiting in one write
+            frames = [frame]
+            while not queue.empty():
+                frame = queue.get_nowait()
+                if frame is None:
+                    done = True
+                    break
+                frames.append(frame)
+            yield b"".join(frames)
+        await producer
+    finally:
+        producer.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await producer
+
+
+async def task_events(request: JsonRpcRequest) -> AsyncGenerator[bytes, None]:
+    """Run a streaming task and yield its SSE frames per A2A v1 spec.
 
     Each SSE event data is a JSON-RPC response where `result` is one of the
     typed objects with a `kind` discriminator: status-update, artifact-update,
     message, or task.
     """
-    params = request.params
-    message = extract_message_from_params(params)
-
-    task_id = str(uuid.uuid4())
-    context_id = message.context_id or str(uuid.uuid4())
-
-    task = Task(
-        id=task_id,
-        context_id=context_id,
-        status=TaskStatus(state=TaskState.SUBMITTED),
-        history=[message],
-    )
-    tasks[task_id] = task
+    message = extract_message_from_params(request.params)
+    task = new_task(message, TaskState.SUBMITTED)
+    task_id, context_id = task.id, task.context_id
 
     # Send initial status: submitted
     yield _sse_event(request.id, TaskStatusUpdateEvent(
@@ -477,13 +761,8 @@ async def stream_send_message(request: JsonRpcRequest):
         final=False,
     ).to_dict())
 
-    message_text = message.get_text()
-
     try:
-        loop = asyncio.get_event_loop()
-        parts, artifacts = await loop.run_in_executor(
-            None, run_agent_and_build_result, message_text, task_id, context_id,
-        )
+        parts, artifacts = build_result(await _run_agent(message.get_text(), context_id))
 
         # Send artifact updates
         for artifact in artifacts:
@@ -510,8 +789,7 @@ async def stream_send_message(request: JsonRpcRequest):
     except Exception as e:
         error_type = type(e).__name__
         error_message = str(e)
-        print(f"ERROR in orchestrator streaming: {error_type}: {error_message}")
-        print(f"Traceback:\n{traceback.format_exc()}")
+        logger.exception("Error in orchestrator streaming: %s: %s", error_type, error_message)
 
         error_msg = Message(
             role="agent", parts=[Part(kind="text", text=f"{error_type}: {error_message}")],
@@ -0,0 +1,100 @@
+"""Bounded, sharded in-memory task store.
+
+Keeps the most recently used tasks up to a fixed capacity and expires
+finished tasks after a time-to-live, so memory stays bounded under load.
+Tasks are spread over independently locked shards so concurrent requests
+rarely contend on the same lock.
+"""
+
+import threading
+import time
+import zlib
+from collections import OrderedDict
+
+from .types import Task, TaskState
+
+# States after which a task no longer changes
+TERMINAL_STATES = frozenset({
+    TaskState.COMPLETED,
+    TaskState.FAILED,
+    TaskState.CANCELED,
+    TaskState.REJECTED,
+})
+
+
+class _Shard:
+    """One LRU partition of the task store."""
+
+    __slots__ = ("entries", "lock", "maxsize")
+
+    def __init__(self, maxsize: int):
+        self.entries: OrderedDict[str, tuple[Task, float]] = OrderedDict()
+        self.lock = threading.Lock()
+        self.maxsize = maxsize
+
+
+class TaskStore:
+    """Sharded LRU task store with TTL expiry for finished tasks.
+
+    Supports the subset of the dict interface used by the server
+    (item assignment, ``get``, ``in`` and ``len``).
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl_seconds: float = 3600.0, shards: int = 16):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        # Never more shards than slots, so every shard holds at least one task;
+        # the remainder is spread over the first shards so capacities sum to maxsize
+        shards = max(1, min(shards, maxsize))
+        base, extra = divmod(maxsize, shards)
+        self._shards = tuple(_Shard(base + (i < extra)) for i in range(shards))
+
+    def _shard(self, task_id: str) -> _Shard:
+        # crc32 rather than hash(), which is salted per process
+        return self._shards[zlib.crc32(task_id.encode()) % len(self._shards)]
+
+    def __setitem__(self, task_id: str, task: Task) -> None:
+        shard = self._shard(task_id)
+        with shard.lock:
+            shard.entries[task_id] = (task, time.monotonic())
+            shard.entries.move_to_end(task_id)
+            while len(shard.entries) > shard.maxsize:
+                shard.entries.popitem(last=False)
+
+    def __contains__(self, task_id: object) -> bool:
+        if not isinstance(task_id, str):
+            return False
+        shard = self._shard(task_id)
+        with shard.lock:
+            return task_id in shard.entries
+
+    def __len__(self) -> int:
+        return sum(len(shard.entries) for shard in self._shards)
+
+    def get(self, task_id: str | None, default: Task | None = None) -> Task | None:
+        """Return the task for task_id, marking it as recently used."""
+        if task_id is None:
+            return default
+        shard = self._shard(task_id)
+        with shard.lock:
+            entry = shard.entries.get(task_id)
+            if entry is None:
+                return default
+            shard.entries.move_to_end(task_id)
+            return entry[0]
+
+    def evict_expired(self) -> int:
+        """Remove finished tasks older than the TTL. Returns the number evicted."""
+        cutoff = time.monotonic() - self.ttl_seconds
+        evicted = 0
+        for shard in self._shards:
+            with shard.lock:
+                expired = [
+                    task_id
+                    for task_id, (task, updated_at) in shard.entries.items()
+                    if updated_at < cutoff and task.status.state in TERMINAL_STATES
+                ]
+                for task_id in expired:
+                    del shard.entries[task_id]
+            evicted += len(expired)
+        return evicted
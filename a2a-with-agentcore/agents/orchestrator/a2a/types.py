@@ -26,7 +26,7 @@ class TaskState(str, Enum):
     REJECTED = "rejected"
 
 
-@dataclass
+@dataclass(slots=True)
 class Part:
     """A content part in a message or artifact.
 
@@ -68,7 +68,7 @@ def data_part(data: dict[str, Any]) -> Part:
     return Part(kind="data", data=data)
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """A message in the A2A v1 protocol.
 
@@ -112,7 +112,7 @@ class Message:
         return " ".join(p.text for p in self.parts if p.text)
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskStatus:
     """Task status with state, optional message, and timestamp."""
     state: TaskState
@@ -128,8 +128,17 @@ class TaskStatus:
             result["message"] = self.message.to_dict()
         return result
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "TaskStatus":
+        message = data.get("message")
+        return cls(
+            state=TaskState(data["state"]),
+            message=Message.from_dict(message) if message is not None else None,
+            timestamp=data["timestamp"],
+        )
+
 
-@dataclass
+@dataclass(slots=True)
 class Artifact:
     """An artifact produced by a task."""
     artifact_id: str = field(default_factory=lambda: str(uuid.uuid4()))
@@ -151,8 +160,18 @@ class Artifact:
             result["metadata"] = self.metadata
         return result
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Artifact":
+        return cls(
+            artifact_id=data["artifact_id"],
+            name=data.get("name"),
+            description=data.get("description"),
+            parts=[Part.from_dict(p) for p in data.get("parts", ())],
+            metadata=data.get("metadata"),
+        )
+
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """A task in the A2A v1 protocol.
 
@@ -180,8 +199,19 @@ class Task:
             result["metadata"] = self.metadata
         return result
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Task":
+        return cls(
+            id=data["id"],
+            context_id=data["context_id"],
+            status=TaskStatus.from_dict(data["status"]),
+            artifacts=[Artifact.from_dict(a) for a in data.get("artifacts", ())],
+            history=[Message.from_dict(m) for m in data.get("history", ())],
+            metadata=data.get("metadata"),
+        )
+
 
-@dataclass
+@dataclass(slots=True)
 class TaskStatusUpdateEvent:
     """Streaming event for task status changes.
 
@@ -206,7 +236,7 @@ class TaskStatusUpdateEvent:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskArtifactUpdateEvent:
     """Streaming event for artifact updates.
 
@@ -233,7 +263,7 @@ class TaskArtifactUpdateEvent:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class JsonRpcRequest:
     """JSON-RPC 2.0 request."""
     jsonrpc: str
@@ -251,7 +281,7 @@ class JsonRpcRequest:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class JsonRpcResponse:
     """JSON-RPC 2.0 response."""
     jsonrpc: str
@@ -284,7 +314,7 @@ class ErrorCode:
     TASK_CANCELED = -32002
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentSkill:
     """A skill that an agent can perform."""
     id: str
@@ -299,7 +329,7 @@ class AgentSkill:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentCapabilities:
     """Capabilities of an agent."""
     streaming: bool = True
@@ -312,7 +342,7 @@ class AgentCapabilities:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentCard:
     """Agent Card for A2A discovery."""
     name: str
@@ -3,7 +3,12 @@
 A2A-compliant coordinator agent for the fitness multi-agent system.
 """
 
+import atexit
+import copy
+import logging
+import logging.handlers
 import os
+import queue
 import sys
 
 # Add the agent directory to the path for imports
@@ -13,16 +18,53 @@ import uvicorn
 from a2a.server import create_a2a_app
 
 PORT = int(os.environ.get("ORCHESTRATOR_PORT", "8081"))
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO")
+
+logger = logging.getLogger("orchestrator")
+LOG_FORMAT = "%(asctime)s (%(name)s) [%(levelname)s] %(message)s"
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves record formatting to the listener thread.
+
+    The stock handler formats each record, including its traceback, in the
+    thread that logged it. Here only the message arguments are merged;
+    the exception is formatted by the listener's handler, off the request
+    path.
+    """
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def configure_logging():
+    """Route log records through a queue so handlers write on a background thread.
+
+    Request handlers only enqueue records; a QueueListener thread does the
+    stream I/O, so a slow log collector never blocks the event loop.
+    """
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+
+    logging.basicConfig(level=LOG_LEVEL, handlers=[DeferredQueueHandler(log_queue)])
+    listener.start()
+    atexit.register(listener.stop)
 
 
 def main():
     """Run the Orchestrator agent server."""
+    configure_logging()
     app = create_a2a_app()
 
-    print(f"Orchestrator Agent running on port {PORT}")
-    print(f"A2A Endpoint: http://localhost:{PORT}/")
-    print(f"Agent Card: http://localhost:{PORT}/.well-known/agent.json")
-    print(f"Health Check: http://localhost:{PORT}/health")
+    logger.info("Orchestrator Agent running on port %s", PORT)
+    logger.info("A2A Endpoint: http://localhost:%s/", PORT)
+    logger.info("Agent Card: http://localhost:%s/.well-known/agent.json", PORT)
+    logger.info("Health Check: http://localhost:%s/health", PORT)
 
     uvicorn.run(app, host="0.0.0.0", port=PORT)
 
@@ -1,5 +1,6 @@
 """Orchestrator Agent Tests."""
 
+import asyncio
 import unittest
 from unittest.mock import AsyncMock, patch, MagicMock
 
@@ -55,6 +56,16 @@ class TestA2ATypes(unittest.TestCase):
         self.assertEqual(result["id"], "task-456")
         self.assertEqual(result["status"]["state"], "completed")
 
+    def test_task_round_trip(self):
+        """Should rebuild an equal task from its dict form."""
+        task = Task(
+            id="task-789",
+            context_id="ctx-1",
+            status=TaskStatus(state=TaskState.COMPLETED),
+            history=[Message(role="user", parts=[Part(text="Hello")])],
+        )
+        self.assertEqual(Task.from_dict(task.to_dict()), task)
+
     def test_task_states(self):
         """Should support all v1 task states."""
         self.assertEqual(TaskState.SUBMITTED.value, "submitted")
@@ -88,6 +99,156 @@ class TestA2AClient(unittest.TestCase):
         # Note: Would need async test runner for full test
 
 
+class TestTaskStore(unittest.TestCase):
+    """Tests for the bounded, sharded task store."""
+
+    def _task(self, task_id: str, state: TaskState = TaskState.WORKING) -> Task:
+        return Task(id=task_id, context_id="ctx", status=TaskStatus(state=state))
+
+    def test_shard_capacities_sum_to_maxsize(self):
+        """Should split maxsize across shards without rounding it up or down."""
+        from a2a.store import TaskStore
+
+        for maxsize, shards in ((10_000, 16), (100, 7), (10, 16)):
+            store = TaskStore(maxsize=maxsize, shards=shards)
+            capacities = [shard.maxsize for shard in store._shards]
+            self.assertEqual(sum(capacities), maxsize)
+            self.assertGreaterEqual(min(capacities), 1)
+
+    def test_eviction_stays_within_shard(self):
+        """Should evict only from the full shard, least recently used first."""
+        from a2a.store import TaskStore
+
+        store = TaskStore(maxsize=4, shards=2)
+        by_shard: dict[int, list[str]] = {0: [], 1: []}
+        for i in range(100):
+            task_id = f"task-{i}"
+            by_shard[store._shards.index(store._shard(task_id))].append(task_id)
+        first, second = by_shard[0][:3], by_shard[1][:2]
+
+        for task_id in second:
+            store[task_id] = self._task(task_id)
+        store[first[0]] = self._task(first[0])
+        store[first[1]] = self._task(first[1])
+        store.get(first[0])
+        store[first[2]] = self._task(first[2])
+
+        self.assertNotIn(first[1], store)
+        self.assertIn(first[0], store)
+        self.assertIn(first[2], store)
+        for task_id in second:
+            self.assertIn(task_id, store)
+        self.assertEqual(len(store), 4)
+
+    def test_expires_only_finished_tasks(self):
+        """Should expire finished tasks past the TTL and keep running ones."""
+        from a2a.store import TaskStore
+
+        store = TaskStore(ttl_seconds=0)
+        store["done"] = self._task("done", TaskState.COMPLETED)
+        store["running"] = self._task("running")
+        self.assertEqual(store.evict_expired(), 1)
+        self.assertIsNone(store.get("done"))
+        self.assertIsNotNone(store.get("running"))
+
+
+class TestResponseCache(unittest.TestCase):
+    """Tests for the sub-agent response cache."""
+
+    def test_evicts_least_recently_used(self):
+        """Should drop the least recently used entry when full."""
+        from tools.a2a_tools import ResponseCache
+
+        cache = ResponseCache(maxsize=2, ttl_seconds=60)
+        cache.set("a", {"result": 1})
+        cache.set("b", {"result": 2})
+        cache.get("a")
+        cache.set("c", {"result": 3})
+
+        self.assertEqual(cache.get("a"), {"result": 1})
+        self.assertIsNone(cache.get("b"))
+
+    def test_send_cached_skips_errors(self):
+        """Should reuse successful responses and not cache errors."""
+        from tools.a2a_tools import response_cache, send_cached
+
+        calls = []
+
+        async def make_call():
+            calls.append(1)
+            return {"result": {"ok": True}} if len(calls) > 1 else {"error": {"code": -1}}
+
+        with patch.object(response_cache, "ttl_seconds", 60):
+            for _ in range(3):
+                asyncio.run(send_cached(("test-send-cached",), make_call))
+        self.assertEqual(len(calls), 2)
+
+
+class TestAgentRuns(unittest.TestCase):
+    """Tests for sharing in-flight agent runs."""
+
+    def _run_concurrently(self, *calls: tuple[str, str]) -> int:
+        """Run _run_agent for each (text, context id) at once; return the number of model runs."""
+        import threading
+        import time
+
+        from a2a import server
+
+        runs = []
+        lock = threading.Lock()
+
+        def fake_run(message_text):
+            with lock:
+                runs.append(message_text)
+            time.sleep(0.05)
+            return f"reply to {message_text}"
+
+        async def run_all():
+            return await asyncio.gather(*(server._run_agent(text, ctx) for text, ctx in calls))
+
+        with patch.object(server, "run_agent_sync", fake_run):
+            replies = asyncio.run(run_all())
+        self.assertEqual(replies, [f"reply to {text}" for text, _ in calls])
+        return len(runs)
+
+    def test_shares_identical_concurrent_runs(self):
+        """Should start one run for identical concurrent messages in the same context."""
+        from a2a import server
+
+        with patch.object(server, "SHARE_INFLIGHT_RUNS", True):
+            self.assertEqual(self._run_concurrently(("hi", "ctx"), ("hi", "ctx")), 1)
+            self.assertEqual(self._run_concurrently(("hi", "ctx-a"), ("hi", "ctx-b")), 2)
+
+    def test_sharing_disabled(self):
+        """Should start a run per request when sharing is off."""
+        from a2a import server
+
+        with patch.object(server, "SHARE_INFLIGHT_RUNS", False):
+            self.assertEqual(self._run_concurrently(("hi", "ctx"), ("hi", "ctx")), 2)
+
+
+class TestBedrockLatencyMode(unittest.TestCase):
+    """Tests for selecting the Bedrock latency mode."""
+
+    def _mode(self, model_id: str, setting: str = "optimized") -> str:
+        from a2a.server import bedrock_latency_mode
+
+        with patch.dict("os.environ", {"BEDROCK_PERFORMANCE_CONFIG": setting}):
+            return bedrock_latency_mode(model_id)
+
+    def test_optimized_only_for_supported_models(self):
+        """Should request optimized latency only for models that support it."""
+        self.assertEqual(self._mode("us.meta.llama3-1-70b-instruct-v1:0"), "optimized")
+        self.assertEqual(self._mode("us.meta.llama3-1-405b-instruct-v1:0"), "optimized")
+        self.assertEqual(self._mode("us.meta.llama3-1-8b-instruct-v1:0"), "standard")
+        self.assertEqual(self._mode("us.amazon.nova-lite-v1:0"), "standard")
+
+    def test_unknown_setting_falls_back_to_standard(self):
+        """Should not pass an unrecognized setting through to Bedrock."""
+        with self.assertLogs("orchestrator", level="WARNING"):
+            self.assertEqual(self._mode("us.amazon.nova-pro-v1:0", "fastest"), "standard")
+
+
 class TestOrchestratorFlow(unittest.TestCase):
     """Tests for orchestrator workflow."""
 
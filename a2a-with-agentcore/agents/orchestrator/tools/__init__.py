@@ -3,11 +3,13 @@
 from .a2a_tools import (
     call_biomechanics_lab,
     call_life_sync_agent,
+    plan_and_validate_workout,
     request_workout_compromise,
 )
 
 __all__ = [
     "call_biomechanics_lab",
     "call_life_sync_agent",
+    "plan_and_validate_workout",
     "request_workout_compromise",
 ]
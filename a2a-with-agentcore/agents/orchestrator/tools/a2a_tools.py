@@ -6,17 +6,83 @@ communicate with sub-agents.
 
 import asyncio
 import json
+import os
+import threading
+import time
 import uuid
-from typing import Any
+from collections import OrderedDict
+from typing import Any, Hashable
 
 from strands import tool
 
-from a2a.client import get_biomechanics_client, get_life_sync_client, A2AError
+from a2a.client import get_biomechanics_client, get_life_sync_client, run_on_client_loop, A2AError
 from a2a.types import Message, Part
 
 
+# Seconds to reuse a sub-agent response for identical tool arguments. Off by
+# default: sub-agent output is generative, and a cached reply is replayed to
+# every caller sending the same text
+TOOL_CACHE_TTL = float(os.environ.get("ORCHESTRATOR_TOOL_CACHE_TTL", "0"))
+TOOL_CACHE_MAXSIZE = 1024
+
+
+class ResponseCache:
+    """Thread-safe LRU cache of sub-agent responses with a time-to-live.
+
+    Tools run on the agent's worker threads, so access is guarded by a lock.
+    """
+
+    def __init__(self, maxsize: int = TOOL_CACHE_MAXSIZE, ttl_seconds: float = TOOL_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[Hashable, tuple[dict[str, Any], float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> dict[str, Any] | None:
+        """Return the cached response for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[1] >= self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def set(self, key: Hashable, response: dict[str, Any]) -> None:
+        """Cache a response, evicting the least recently used entries."""
+        if self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (response, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+response_cache = ResponseCache()
+
+
+async def send_cached(key: Hashable | None, make_call) -> dict[str, Any]:
+    """Run make_call, reusing a cached response for the same key.
+
+    Only successful responses are cached. A key of None bypasses the cache.
+    """
+    if key is not None:
+        cached = response_cache.get(key)
+        if cached is not None:
+            return cached
+
+    result = await run_on_client_loop(make_call())
+
+    if key is not None and "result" in result and "error" not in result:
+        response_cache.set(key, result)
+    return result
+
+
 @tool
-def call_biomechanics_lab(
+async def call_biomechanics_lab(
     goal: str,
     equipment: list[str],
     muscle_groups: list[str],
@@ -81,11 +147,11 @@ def call_biomechanics_lab(
             result = await client.send_task(task_id, message)
             return result
 
-    try:
-        result = asyncio.get_event_loop().run_until_complete(make_call())
-    except RuntimeError:
-        # No event loop running, create a new one
-        result = asyncio.run(make_call())
+    # Compromise requests are refinements and always go to the agent
+    cache_key = None if is_compromise else (
+        "biomechanics", goal, tuple(sorted(equipment)), tuple(sorted(muscle_groups)), duration_minutes,
+    )
+    result = await send_cached(cache_key, make_call)
 
     # Extract the result
     if "result" in result:
@@ -104,7 +170,7 @@ def call_biomechanics_lab(
 
 
 @tool
-def call_life_sync_agent(
+async def call_life_sync_agent(
     workout_name: str,
     duration_minutes: int,
     required_equipment: list[str],
@@ -165,10 +231,10 @@ def call_life_sync_agent(
             result = await client.send_task(task_id, message)
             return result
 
-    try:
-        result = asyncio.get_event_loop().run_until_complete(make_call())
-    except RuntimeError:
-        result = asyncio.run(make_call())
+    cache_key = (
+        "life-sync", workout_name, duration_minutes, tuple(sorted(required_equipment)), date, location,
+    )
+    result = await send_cached(cache_key, make_call)
 
     # Extract the analysis
     if "result" in result:
@@ -185,7 +251,7 @@ def call_life_sync_agent(
 
 
 @tool
-def request_workout_compromise(
+async def request_workout_compromise(
     original_goal: str,
     conflicts: list[dict[str, Any]],
     available_equipment: list[str],
@@ -250,10 +316,7 @@ Please prioritize intensity over duration. Suggest alternatives that maintain tr
             result = await client.send_task(task_id, message)
             return result
 
-    try:
-        result = asyncio.get_event_loop().run_until_complete(make_call())
-    except RuntimeError:
-        result = asyncio.run(make_call())
+    result = await send_cached(None, make_call)
 
     # Extract the result
     if "result" in result:
@@ -271,3 +334,48 @@ Please prioritize intensity over duration. Suggest alternatives that maintain tr
         return task_result
 
     return {"error": "No result from Biomechanics Lab"}
+
+
+@tool
+async def plan_and_validate_workout(
+    goal: str,
+    equipment: list[str],
+    muscle_groups: list[str],
+    duration_minutes: int = 60,
+    date: str = "",
+    location: str = "home",
+) -> dict[str, Any]:
+    """Create a workout plan and validate it against the user's constraints.
+
+    Use this tool for a new workout request. It asks the Biomechanics Lab for
+    a plan and checks the Life Sync agent for schedule and equipment conflicts
+    at the same time, instead of calling each agent in turn.
+
+    Args:
+        goal: The fitness goal (e.g., "upper body hypertrophy", "full body strength").
+        equipment: List of available equipment. Use empty list [] for bodyweight only.
+        muscle_groups: Target muscle groups. Use empty list [] for full body.
+        duration_minutes: Desired workout length in minutes (default: 60).
+        date: Date to check availability (YYYY-MM-DD format, empty means today).
+        location: Location to check equipment (default: "home").
+
+    Returns:
+        The workout plan under "workout" and the conflict analysis under "validation".
+    """
+    workout, validation = await asyncio.gather(
+        call_biomechanics_lab(
+            goal=goal,
+            equipment=equipment,
+            muscle_groups=muscle_groups,
+            duration_minutes=duration_minutes,
+        ),
+        call_life_sync_agent(
+            workout_name=goal,
+            duration_minutes=duration_minutes,
+            required_equipment=equipment,
+            date=date,
+            location=location,
+        ),
+    )
+
+    return {"workout": workout, "validation": validation}
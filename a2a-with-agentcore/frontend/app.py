@@ -1,13 +1,22 @@
 """Streamlit Frontend for Momentum Fitness - Modern Dark Design."""
 
-import json
+import functools
+import html
 import os
+import re
+import time
+import traceback
 import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
 from typing import Any
 
+import boto3
+import orjson
 import requests
 import streamlit as st
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 
 # Load environment variables
 load_dotenv()
@@ -28,6 +37,16 @@ LIFESYNC_RUNTIME_ID = os.getenv("LIFESYNC_RUNTIME_ID", "")
 BIOMECHANICS_ARN = os.getenv("BIOMECHANICS_RUNTIME_ARN", "")
 LIFESYNC_ARN = os.getenv("LIFESYNC_RUNTIME_ARN", "")
 
+# Agent runtimes shown in the Observability tab
+AGENT_RUNTIME_ARNS = {
+    "🧠 Orchestrator": ORCHESTRATOR_ARN,
+    "🧬 Biomechanics Lab": BIOMECHANICS_ARN,
+    "📅 Life Sync": LIFESYNC_ARN,
+}
+
+# Structured JSON in agent text, as a ```json fenced block
+JSON_FENCE_RE = re.compile(r'```json\s*\n?(.*?)\n?```', re.DOTALL)
+
 # Stockpeers-inspired color palette
 BG_DARK = "#1a2332"  # Dark navy background
 BG_CARD = "#243447"  # Darker navy for cards
@@ -41,10 +60,8 @@ SUCCESS_GREEN = "#10b981"  # Green for positive indicators
 ERROR_RED = "#ef4444"  # Red for negative indicators
 
 
-def apply_dark_styling():
-    """Apply stockpeers-inspired dark navy styling."""
-    st.markdown(
-        f"""
+# Page styling, built once at import since it only depends on the palette
+DARK_STYLE_CSS = f"""
         <style>
         @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&display=swap');
 
@@ -223,53 +240,173 @@ def apply_dark_styling():
         footer {{visibility: hidden;}}
         header {{visibility: hidden;}}
         </style>
-        """,
-        unsafe_allow_html=True,
-    )
+        """
 
 
-def _get_agentcore_client():
-    """Get boto3 AgentCore client."""
-    if "agentcore_client" not in st.session_state:
-        import boto3
-        if AWS_PROFILE:
-            session = boto3.Session(profile_name=AWS_PROFILE, region_name=AWS_REGION)
-            st.session_state.agentcore_client = session.client("bedrock-agentcore")
-        else:
-            st.session_state.agentcore_client = boto3.client(
-                "bedrock-agentcore", region_name=AWS_REGION
-            )
-    return st.session_state.agentcore_client
+def apply_dark_styling():
+    """Apply stockpeers-inspired dark navy styling."""
+    st.markdown(DARK_STYLE_CSS, unsafe_allow_html=True)
+
+
+def _boto3_session(profile: str, region: str):
+    """Create a boto3 session for the configured profile and region."""
+    if profile:
+        return boto3.Session(profile_name=profile, region_name=region)
+    return boto3.Session(region_name=region)
+
+
+@st.cache_resource
+def get_agentcore_client(profile: str, region: str):
+    """Get the boto3 AgentCore client, shared across reruns and sessions."""
+    return _boto3_session(profile, region).client("bedrock-agentcore")
+
+
+@st.cache_resource
+def get_logs_client(profile: str, region: str):
+    """Get the boto3 CloudWatch Logs client, shared across reruns and sessions."""
+    return _boto3_session(profile, region).client("logs")
+
+
+@st.cache_resource
+def get_http_session() -> requests.Session:
+    """Get a keep-alive HTTP session for the local orchestrator, shared across reruns."""
+    session = requests.Session()
+    session.headers.update({"Content-Type": "application/json"})
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+LOG_CACHE_TTL_SECONDS = 15
+LOG_WINDOW_MINUTES = 30
+LOG_DISPLAY_LIMIT = 100
+
+
+def format_log_time(timestamp_ms: int, utc_offset_seconds: int) -> str:
+    """Format an epoch millisecond timestamp as local HH:MM:SS without building a datetime."""
+    seconds = timestamp_ms // 1000 + utc_offset_seconds
+    return f"{seconds // 3600 % 24:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+
+
+def fetch_recent_logs(logs_client, log_group_name: str) -> list[tuple[int, str]]:
+    """Fetch recent (timestamp_ms, message) log events for a log group, newest first.
+
+    Events from the most recent streams are fetched in parallel.
+    """
+    # Get logs from last 30 minutes
+    end_time = datetime.now()
+    start_time = end_time - timedelta(minutes=LOG_WINDOW_MINUTES)
+
+    # Get log streams
+    streams_response = logs_client.describe_log_streams(
+        logGroupName=log_group_name,
+        orderBy='LastEventTime',
+        descending=True,
+        limit=5
+    )
+
+    # Streams are independent, so fetch their events concurrently
+    streams = streams_response.get('logStreams', [])
+    all_logs = []
+    if streams:
+        with ThreadPoolExecutor(max_workers=len(streams)) as executor:
+            futures = [
+                executor.submit(
+                    logs_client.get_log_events,
+                    logGroupName=log_group_name,
+                    logStreamName=stream['logStreamName'],
+                    startTime=int(start_time.timestamp() * 1000),
+                    endTime=int(end_time.timestamp() * 1000),
+                    limit=50
+                )
+                for stream in streams
+            ]
+            for future in as_completed(futures):
+                for event in future.result().get('events', []):
+                    all_logs.append((event['timestamp'], event['message']))
+
+    # Sort by timestamp
+    all_logs.sort(reverse=True)
+    return all_logs
+
+
+@functools.lru_cache(maxsize=8)
+def runtime_log_group(runtime_arn: str) -> str | None:
+    """Get the CloudWatch log group of an AgentCore runtime from its ARN.
+
+    Returns None if the ARN has no runtime name.
+    """
+    # ARN format: arn:aws:bedrock-agentcore:region:account:runtime/runtime-name
+    _, sep, runtime_name = runtime_arn.rpartition("/")
+    if not sep or not runtime_name:
+        return None
+    return f"/aws/bedrock-agentcore/runtimes/{runtime_name}-DEFAULT"
+
+
+@st.cache_data(ttl=LOG_CACHE_TTL_SECONDS, show_spinner=False)
+def fetch_agent_logs(region: str, profile: str, window_bucket: int) -> dict[str, list[tuple[int, str]] | str]:
+    """Fetch the recent logs of every configured agent in parallel, keyed by log group.
+
+    A log group whose fetch failed maps to its error message. Results are
+    cached per window_bucket, so switching agents or rerunning within the
+    same bucket reads from the cache instead of calling CloudWatch again.
+    """
+    log_groups = [log_group for arn in AGENT_RUNTIME_ARNS.values() if arn and (log_group := runtime_log_group(arn))]
+    if not log_groups:
+        return {}
+
+    # Resolved here, since worker threads have no Streamlit script context
+    logs_client = get_logs_client(profile, region)
+
+    logs_by_group: dict[str, list[tuple[int, str]] | str] = {}
+    with ThreadPoolExecutor(max_workers=len(log_groups)) as executor:
+        futures = {
+            executor.submit(fetch_recent_logs, logs_client, log_group): log_group
+            for log_group in log_groups
+        }
+        for future in as_completed(futures):
+            try:
+                logs_by_group[futures[future]] = future.result()
+            except Exception as e:
+                logs_by_group[futures[future]] = str(e)
+    return logs_by_group
+
+
+# Static parts of the tasks/send request, encoded once. Only the task id and
+# prompt change per request, so those are the only values encoded each time.
+TASK_REQUEST_HEAD = b'{"jsonrpc":"2.0","id":'
+TASK_REQUEST_PARAMS = b',"method":"tasks/send","params":{"task":{"id":'
+TASK_REQUEST_MESSAGE = b',"message":{"role":"user","parts":[{"type":"text","text":'
+TASK_REQUEST_TAIL = b'}]}}}}'
+
+
+def encode_task_request(task_id: str, prompt: str) -> bytes:
+    """Encode the JSON-RPC tasks/send request for a prompt."""
+    encoded_id = orjson.dumps(task_id)
+    return b"".join((
+        TASK_REQUEST_HEAD, encoded_id,
+        TASK_REQUEST_PARAMS, encoded_id,
+        TASK_REQUEST_MESSAGE, orjson.dumps(prompt),
+        TASK_REQUEST_TAIL,
+    ))
 
 
 def send_workout_request(prompt: str) -> dict[str, Any]:
     """Send workout request to orchestrator."""
     task_id = f"workout-{uuid.uuid4().hex[:8]}"
 
-    request_payload = {
-        "jsonrpc": "2.0",
-        "id": task_id,
-        "method": "tasks/send",
-        "params": {
-            "task": {
-                "id": task_id,
-                "message": {
-                    "role": "user",
-                    "parts": [{"type": "text", "text": prompt}],
-                },
-            }
-        },
-    }
+    request_payload = encode_task_request(task_id, prompt)
 
     if USE_AGENTCORE_BOTO3:
         try:
-            client = _get_agentcore_client()
+            client = get_agentcore_client(AWS_PROFILE, AWS_REGION)
             response = client.invoke_agent_runtime(
                 agentRuntimeArn=ORCHESTRATOR_ARN,
                 qualifier="DEFAULT",
                 contentType="application/json",
                 accept="application/json",
-                payload=json.dumps(request_payload),
+                payload=request_payload,
             )
 
             # Capture session ID from the invoke_agent_runtime response
@@ -281,13 +418,19 @@ def send_workout_request(prompt: str) -> dict[str, Any]:
             else:
                 print(f"No sessionId in response. Keys: {response.keys()}")
 
+            # Read the body as bytes in one go and decode once, inside orjson.loads
             response_body = response.get("response")
-            raw = ""
-            if response_body:
-                for chunk in response_body:
-                    raw += chunk.decode("utf-8") if isinstance(chunk, bytes) else chunk
+            if hasattr(response_body, "read"):
+                raw = response_body.read()
+            elif response_body:
+                raw = b"".join(
+                    chunk if isinstance(chunk, (bytes, bytearray)) else chunk.encode("utf-8")
+                    for chunk in response_body
+                )
+            else:
+                raw = b""
 
-            parsed_response = json.loads(raw)
+            parsed_response = orjson.loads(raw)
 
             # Debug: show full response
             if "result" in parsed_response and "result" in parsed_response["result"]:
@@ -301,24 +444,23 @@ def send_workout_request(prompt: str) -> dict[str, Any]:
             return parsed_response
         except Exception as e:
             st.error(f"⚠️ Error: {e}")
-            import traceback
             st.error(f"Traceback: {traceback.format_exc()}")
             return {}
     else:
         try:
             url = f"{ORCHESTRATOR_URL}/"
-            response = requests.post(url, json=request_payload, timeout=60)
+            response = get_http_session().post(url, data=request_payload, timeout=60)
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except Exception as e:
             st.error(f"⚠️ Error: {e}")
             return {}
 
 
-def render_exercise_card(exercise: dict[str, Any], index: int):
-    """Render a single exercise card."""
-    st.markdown(
-        f"""
+# Exercise card markup with the palette baked in; fields are filled with str.format.
+# Optional rows share a line so a missing row never leaves a blank line, which
+# would end the HTML block when several cards are rendered together.
+EXERCISE_CARD_TEMPLATE = f"""
         <div style="
             background: linear-gradient(135deg, {BG_CARD} 0%, {BG_DARK} 100%);
             border: 1px solid {BORDER_DARK};
@@ -328,34 +470,167 @@ def render_exercise_card(exercise: dict[str, Any], index: int):
             transition: all 0.3s ease;
         ">
             <div style="color: {TEXT_PRIMARY}; font-size: 1.5rem; font-weight: 700; margin-bottom: 1rem;">
-                {index}. {exercise.get('name', 'Exercise')}
+                {{index}}. {{name}}
             </div>
             <div style="color: {TEXT_SECONDARY}; font-size: 1rem; line-height: 1.8;">
-                <div style="margin: 0.5rem 0;">💪 <strong>Muscle Group:</strong> {exercise.get('muscle_group', 'N/A')}</div>
-                <div style="margin: 0.5rem 0;">🏋️ <strong>Equipment:</strong> {exercise.get('equipment', 'N/A')}</div>
-                <div style="margin: 0.5rem 0;">📊 <strong>Sets:</strong> {exercise.get('sets', 'N/A')}</div>
-                <div style="margin: 0.5rem 0;">🔄 <strong>Reps:</strong> {exercise.get('reps', 'N/A')}</div>
-                <div style="margin: 0.5rem 0;">⏱️ <strong>Rest:</strong> {exercise.get('rest', 'N/A')}</div>
-                {f'<div style="margin: 0.5rem 0;">⏰ <strong>Duration:</strong> {exercise.get("duration")}</div>' if exercise.get('duration') else ''}
-                {f'<div style="margin-top: 1rem; padding-top: 1rem; border-top: 1px solid {BORDER_DARK}; color: {ACCENT_BLUE}; font-style: italic;">💡 {exercise.get("notes")}</div>' if exercise.get('notes') else ''}
+                <div style="margin: 0.5rem 0;">💪 <strong>Muscle Group:</strong> {{muscle_group}}</div>
+                <div style="margin: 0.5rem 0;">🏋️ <strong>Equipment:</strong> {{equipment}}</div>
+                <div style="margin: 0.5rem 0;">📊 <strong>Sets:</strong> {{sets}}</div>
+                <div style="margin: 0.5rem 0;">🔄 <strong>Reps:</strong> {{reps}}</div>
+                <div style="margin: 0.5rem 0;">⏱️ <strong>Rest:</strong> {{rest}}</div>{{duration_row}}{{notes_row}}
             </div>
         </div>
-        """,
-        unsafe_allow_html=True,
+        """
+EXERCISE_DURATION_TEMPLATE = '<div style="margin: 0.5rem 0;">⏰ <strong>Duration:</strong> {duration}</div>'
+EXERCISE_NOTES_TEMPLATE = f'<div style="margin-top: 1rem; padding-top: 1rem; border-top: 1px solid {BORDER_DARK}; color: {ACCENT_BLUE}; font-style: italic;">💡 {{notes}}</div>'
+
+TIME_SLOT_TEMPLATE = f'<div style="background: linear-gradient(135deg, {BG_CARD} 0%, {BG_DARK} 100%); border: 1px solid {BORDER_DARK}; border-radius: 12px; padding: 1rem 1.5rem; min-width: 150px; text-align: center; color: {TEXT_PRIMARY}; font-weight: 600; flex-shrink: 0; transition: all 0.3s ease; cursor: pointer;" onmouseover="this.style.borderColor=\'{ACCENT_BLUE}\'; this.style.boxShadow=\'0 0 20px rgba(96, 165, 250, 0.3)\';" onmouseout="this.style.borderColor=\'{BORDER_DARK}\'; this.style.boxShadow=\'none\';">🕐 {{slot}}</div>'
+
+# Deployment info card for one agent runtime, laid out three across in a CSS grid
+DEPLOYMENT_CARD_TEMPLATE = (
+    f'<div style="background: {BG_CARD}; border: 1px solid {BORDER_DARK}; border-radius: 12px; padding: 1.5rem; height: 100%;">'
+    f'<div style="color: {ACCENT_BLUE}; font-size: 1.1rem; font-weight: 600; margin-bottom: 1rem;">{{title}}</div>'
+    f'<div style="color: {TEXT_SECONDARY}; font-size: 0.875rem; line-height: 1.8;">'
+    f'<div style="margin-bottom: 0.75rem;">'
+    f'<strong style="color: {TEXT_PRIMARY};">Runtime ARN:</strong><br/>'
+    f'<span style="font-family: monospace; font-size: 0.75rem; color: {ACCENT_BLUE}; word-break: break-all;">{{arn}}</span>'
+    f'</div>'
+    f'<div><strong style="color: {TEXT_PRIMARY};">Region:</strong> {{region}}</div>'
+    f'</div>'
+    f'</div>'
+)
+
+
+def build_exercise_card_html(exercise: dict[str, Any], index: int) -> str:
+    """Build the HTML for a single exercise card."""
+    # Exercise fields come from the model, so escape them before injecting
+    def field(key: str, default: str = 'N/A') -> str:
+        return html.escape(str(exercise.get(key, default)))
+
+    duration = exercise.get('duration')
+    notes = exercise.get('notes')
+    return EXERCISE_CARD_TEMPLATE.format(
+        index=index,
+        name=field('name', 'Exercise'),
+        muscle_group=field('muscle_group'),
+        equipment=field('equipment'),
+        sets=field('sets'),
+        reps=field('reps'),
+        rest=field('rest'),
+        duration_row=EXERCISE_DURATION_TEMPLATE.format(duration=html.escape(str(duration))) if duration else '',
+        notes_row=EXERCISE_NOTES_TEMPLATE.format(notes=html.escape(str(notes))) if notes else '',
     )
 
 
+def render_exercise_cards(exercises: list[dict[str, Any]]):
+    """Render all exercise cards in a single markdown element."""
+    cards_html = ''.join(build_exercise_card_html(exercise, idx) for idx, exercise in enumerate(exercises, 1))
+    st.markdown(cards_html, unsafe_allow_html=True)
+
+
 def render_time_slots(time_slots: list[str]):
     """Render time slots in a horizontal row."""
-    slots_html = '<div style="display: flex; gap: 1rem; overflow-x: auto; padding: 1rem 0;">'
+    # Escape the slot values to prevent HTML issues
+    slots_html = ''.join(TIME_SLOT_TEMPLATE.format(slot=html.escape(str(slot))) for slot in time_slots)
+    st.markdown(
+        f'<div style="display: flex; gap: 1rem; overflow-x: auto; padding: 1rem 0;">{slots_html}</div>',
+        unsafe_allow_html=True,
+    )
+
+
+def parse_workout_response(response: dict[str, Any]) -> tuple[dict[str, Any] | None, str]:
+    """Extract the structured workout data and reply text from an orchestrator response."""
+    parts = response["result"]["result"].get("parts", [])
+
+    # A data part with a workout is all that gets rendered, so skip the text entirely
+    data_part = next((part for part in parts if part.get("type") == "data"), None)
+    structured_data = data_part.get("data", {}) if data_part else None
+    if structured_data and "workout" in structured_data:
+        return structured_data, ""
+
+    text_response = next((part.get("text", "") for part in parts if part.get("type") == "text"), "")
+
+    # Try to extract JSON from text if no structured data
+    if not structured_data and text_response:
+        json_match = JSON_FENCE_RE.search(text_response)
+        if json_match:
+            try:
+                structured_data = orjson.loads(json_match.group(1).strip())
+            except:
+                pass
 
-    for slot in time_slots:
-        # Escape the slot value to prevent HTML issues
-        safe_slot = str(slot).replace('<', '&lt;').replace('>', '&gt;')
-        slots_html += f'<div style="background: linear-gradient(135deg, {BG_CARD} 0%, {BG_DARK} 100%); border: 1px solid {BORDER_DARK}; border-radius: 12px; padding: 1rem 1.5rem; min-width: 150px; text-align: center; color: {TEXT_PRIMARY}; font-weight: 600; flex-shrink: 0; transition: all 0.3s ease; cursor: pointer;" onmouseover="this.style.borderColor=\'{ACCENT_BLUE}\'; this.style.boxShadow=\'0 0 20px rgba(96, 165, 250, 0.3)\';" onmouseout="this.style.borderColor=\'{BORDER_DARK}\'; this.style.boxShadow=\'none\';">🕐 {safe_slot}</div>'
+    return structured_data, text_response
 
-    slots_html += '</div>'
-    st.markdown(slots_html, unsafe_allow_html=True)
+
+def render_workout_result(response: dict[str, Any], structured_data: dict[str, Any] | None, text_response: str):
+    """Render a parsed workout plan, or the raw reply if it has no workout."""
+    if structured_data and "workout" in structured_data:
+        workout = structured_data["workout"]
+
+        st.markdown("---")
+        st.markdown(f"## {workout.get('title', 'Your Workout Plan')}")
+
+        # Exercises
+        exercises = workout.get("exercises", [])
+        if exercises:
+            render_exercise_cards(exercises)
+
+        # Schedule
+        if "schedule" in structured_data:
+            schedule = structured_data["schedule"]
+
+            st.markdown("---")
+            st.markdown("## 📅 Available Time Slots")
+
+            if schedule.get("message"):
+                st.markdown(f'<p style="color: {TEXT_PRIMARY}; font-size: 1rem; margin-bottom: 1rem;">{html.escape(str(schedule["message"]))}</p>', unsafe_allow_html=True)
+
+            if schedule.get("available_times"):
+                render_time_slots(schedule["available_times"])
+    else:
+        # Fallback to text display
+        st.markdown("### Response")
+        st.write(text_response)
+
+        # Show full response for debugging
+        if st.session_state.get("last_full_response"):
+            with st.expander("🔍 Debug: Full Agent Response"):
+                st.code(st.session_state.last_full_response, language="text")
+
+        with st.expander("🔍 Debug: Raw Response"):
+            st.json(response)
+
+
+@st.fragment
+def workout_result_fragment(prompt: str):
+    """Generate and show the workout plan.
+
+    Runs as a fragment, so the Generate button reruns only this section.
+    The parsed result is kept in session_state and redrawn on later
+    reruns without calling the orchestrator again.
+    """
+    if st.button("🚀 Generate Workout Plan", use_container_width=True):
+        # Show progress
+        with st.status("🤖 Generating your workout plan...", expanded=True) as status:
+            st.write("📤 Sending request to orchestrator...")
+            st.write("🧬 Consulting Biomechanics Lab...")
+            st.write("📅 Validating with Life Sync Agent...")
+
+            response = send_workout_request(prompt)
+
+            if response:
+                status.update(label="✅ Workout plan ready!", state="complete", expanded=False)
+            else:
+                status.update(label="❌ Failed", state="error", expanded=True)
+
+        if response and "result" in response and "result" in response["result"]:
+            st.session_state.workout_result = (response, *parse_workout_response(response))
+        else:
+            st.session_state.pop("workout_result", None)
+
+    # Render results
+    if "workout_result" in st.session_state:
+        render_workout_result(*st.session_state.workout_result)
 
 
 def main():
@@ -434,103 +709,28 @@ def main():
             )
 
         # Build prompt from inputs
-        if st.button("🚀 Generate Workout Plan", use_container_width=True):
-            prompt_parts = [f"Create a {goal.lower()} workout"]
-
-            if duration:
-                prompt_parts.append(f"for {duration} minutes")
-
-            if muscle_groups:
-                prompt_parts.append(f"targeting {', '.join(muscle_groups).lower()}")
-
-            if equipment:
-                prompt_parts.append(f"using {', '.join(equipment).lower()}")
-            elif not equipment:
-                prompt_parts.append("with bodyweight only")
-
-            if exercise_types:
-                prompt_parts.append(f"with {', '.join(exercise_types).lower()} exercises")
-
-            prompt = " ".join(prompt_parts) + "."
-
-            if additional_notes:
-                prompt += f" Note: {additional_notes}"
-
-            # Show progress
-            with st.status("🤖 Generating your workout plan...", expanded=True) as status:
-                st.write("📤 Sending request to orchestrator...")
-                st.write("🧬 Consulting Biomechanics Lab...")
-                st.write("📅 Validating with Life Sync Agent...")
-
-                response = send_workout_request(prompt)
-
-                if response:
-                    status.update(label="✅ Workout plan ready!", state="complete", expanded=False)
-                else:
-                    status.update(label="❌ Failed", state="error", expanded=True)
-
-            # Render results
-            if response and "result" in response:
-                result = response["result"]
-
-                if "result" in result:
-                    parts = result["result"].get("parts", [])
+        prompt_parts = [f"Create a {goal.lower()} workout"]
 
-                    structured_data = None
-                    text_response = ""
+        if duration:
+            prompt_parts.append(f"for {duration} minutes")
 
-                    for part in parts:
-                        if part.get("type") == "text":
-                            text_response = part.get("text", "")
-                        elif part.get("type") == "data":
-                            structured_data = part.get("data", {})
+        if muscle_groups:
+            prompt_parts.append(f"targeting {', '.join(muscle_groups).lower()}")
 
-                    # Try to extract JSON from text if no structured data
-                    if not structured_data and text_response:
-                        import re
-                        json_match = re.search(r'```json\s*\n?(.*?)\n?```', text_response, re.DOTALL)
-                        if json_match:
-                            try:
-                                structured_data = json.loads(json_match.group(1).strip())
-                            except:
-                                pass
+        if equipment:
+            prompt_parts.append(f"using {', '.join(equipment).lower()}")
+        elif not equipment:
+            prompt_parts.append("with bodyweight only")
 
-                    # Render workout
-                    if structured_data and "workout" in structured_data:
-                        workout = structured_data["workout"]
+        if exercise_types:
+            prompt_parts.append(f"with {', '.join(exercise_types).lower()} exercises")
 
-                        st.markdown("---")
-                        st.markdown(f"## {workout.get('title', 'Your Workout Plan')}")
+        prompt = " ".join(prompt_parts) + "."
 
-                        # Exercises
-                        exercises = workout.get("exercises", [])
-                        for idx, exercise in enumerate(exercises, 1):
-                            render_exercise_card(exercise, idx)
+        if additional_notes:
+            prompt += f" Note: {additional_notes}"
 
-                        # Schedule
-                        if "schedule" in structured_data:
-                            schedule = structured_data["schedule"]
-
-                            st.markdown("---")
-                            st.markdown("## 📅 Available Time Slots")
-
-                            if schedule.get("message"):
-                                st.markdown(f'<p style="color: {TEXT_PRIMARY}; font-size: 1rem; margin-bottom: 1rem;">{schedule["message"]}</p>', unsafe_allow_html=True)
-
-                            if schedule.get("available_times"):
-                                render_time_slots(schedule["available_times"])
-                    else:
-                        # Fallback to text display
-                        st.markdown("### Response")
-                        st.write(text_response)
-
-                        # Show full response for debugging
-                        if st.session_state.get("last_full_response"):
-                            with st.expander("🔍 Debug: Full Agent Response"):
-                                st.code(st.session_state.last_full_response, language="text")
-
-                        with st.expander("🔍 Debug: Raw Response"):
-                            st.json(response)
+        workout_result_fragment(prompt)
 
     with tab2:
         st.markdown("## Deployment Configuration")
@@ -545,55 +745,18 @@ def main():
         # Agent Details - Same card styling for all three agents
         st.markdown(f'<h3 style="color: {TEXT_PRIMARY}; margin-top: 2rem;">Agent Runtime Details</h3>', unsafe_allow_html=True)
 
-        col1, col2, col3 = st.columns(3)
-
-        with col1:
-            st.markdown(f"""
-            <div style="background: {BG_CARD}; border: 1px solid {BORDER_DARK}; border-radius: 12px; padding: 1.5rem; height: 100%;">
-                <div style="color: {ACCENT_BLUE}; font-size: 1.1rem; font-weight: 600; margin-bottom: 1rem;">🧠 Orchestrator</div>
-                <div style="color: {TEXT_SECONDARY}; font-size: 0.875rem; line-height: 1.8;">
-                    <div style="margin-bottom: 0.75rem;">
-                        <strong style="color: {TEXT_PRIMARY};">Runtime ARN:</strong><br/>
-                        <span style="font-family: monospace; font-size: 0.75rem; color: {ACCENT_BLUE}; word-break: break-all;">
-                            {ORCHESTRATOR_ARN or 'Not configured'}
-                        </span>
-                    </div>
-                    <div><strong style="color: {TEXT_PRIMARY};">Region:</strong> {AWS_REGION}</div>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col2:
-            st.markdown(f"""
-            <div style="background: {BG_CARD}; border: 1px solid {BORDER_DARK}; border-radius: 12px; padding: 1.5rem; height: 100%;">
-                <div style="color: {ACCENT_BLUE}; font-size: 1.1rem; font-weight: 600; margin-bottom: 1rem;">🧬 Biomechanics Lab</div>
-                <div style="color: {TEXT_SECONDARY}; font-size: 0.875rem; line-height: 1.8;">
-                    <div style="margin-bottom: 0.75rem;">
-                        <strong style="color: {TEXT_PRIMARY};">Runtime ARN:</strong><br/>
-                        <span style="font-family: monospace; font-size: 0.75rem; color: {ACCENT_BLUE}; word-break: break-all;">
-                            {BIOMECHANICS_ARN or 'Not configured'}
-                        </span>
-                    </div>
-                    <div><strong style="color: {TEXT_PRIMARY};">Region:</strong> {AWS_REGION}</div>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col3:
-            st.markdown(f"""
-            <div style="background: {BG_CARD}; border: 1px solid {BORDER_DARK}; border-radius: 12px; padding: 1.5rem; height: 100%;">
-                <div style="color: {ACCENT_BLUE}; font-size: 1.1rem; font-weight: 600; margin-bottom: 1rem;">📅 Life Sync</div>
-                <div style="color: {TEXT_SECONDARY}; font-size: 0.875rem; line-height: 1.8;">
-                    <div style="margin-bottom: 0.75rem;">
-                        <strong style="color: {TEXT_PRIMARY};">Runtime ARN:</strong><br/>
-                        <span style="font-family: monospace; font-size: 0.75rem; color: {ACCENT_BLUE}; word-break: break-all;">
-                            {LIFESYNC_ARN or 'Not configured'}
-                        </span>
-                    </div>
-                    <div><strong style="color: {TEXT_PRIMARY};">Region:</strong> {AWS_REGION}</div>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+        cards_html = ''.join(
+            DEPLOYMENT_CARD_TEMPLATE.format(title=title, arn=html.escape(arn or 'Not configured'), region=AWS_REGION)
+            for title, arn in (
+                ("🧠 Orchestrator", ORCHESTRATOR_ARN),
+                ("🧬 Biomechanics Lab", BIOMECHANICS_ARN),
+                ("📅 Life Sync", LIFESYNC_ARN),
+            )
+        )
+        st.markdown(
+            f'<div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 1rem;">{cards_html}</div>',
+            unsafe_allow_html=True,
+        )
 
         st.markdown(f'<h3 style="color: {TEXT_PRIMARY}; margin-top: 2rem;">🔧 Environment Variables</h3>', unsafe_allow_html=True)
         with st.expander("View Configuration"):
@@ -613,104 +776,47 @@ def main():
             # Agent selector - auto-loads logs when changed
             selected_agent = st.selectbox(
                 "Select Agent",
-                ["🧠 Orchestrator", "🧬 Biomechanics Lab", "📅 Life Sync"],
+                list(AGENT_RUNTIME_ARNS),
                 key="agent_selector"
             )
 
-            # Map selection to ARN
-            agent_arn_map = {
-                "🧠 Orchestrator": ORCHESTRATOR_ARN,
-                "🧬 Biomechanics Lab": BIOMECHANICS_ARN,
-                "📅 Life Sync": LIFESYNC_ARN
-            }
-
-            selected_arn = agent_arn_map.get(selected_agent)
+            selected_arn = AGENT_RUNTIME_ARNS.get(selected_agent)
 
-            if selected_arn:
-                try:
-                    # ARN format: arn:aws:bedrock-agentcore:region:account:runtime/runtime-name
-                    runtime_name = selected_arn.split("/")[-1]
-                    log_group_name = f"/aws/bedrock-agentcore/runtimes/{runtime_name}-DEFAULT"
+            # All agents' logs are fetched together once per cache window
+            window_bucket = int(time.time() // LOG_CACHE_TTL_SECONDS)
 
-                    # Display log group name at top with white label
-                    st.markdown(f'<p style="color: {TEXT_PRIMARY}; margin-bottom: 1rem;"><strong>Log Group:</strong> <code style="color: {ACCENT_BLUE};">{log_group_name}</code></p>', unsafe_allow_html=True)
-                except Exception as e:
-                    st.error(f"Error parsing ARN: {e}")
-                    selected_arn = None
+            log_group_name = runtime_log_group(selected_arn) if selected_arn else None
+            if not selected_arn:
+                st.warning(f"ARN not configured for {selected_agent}")
+            elif log_group_name is None:
+                st.error(f"Error parsing ARN: no runtime name in {selected_arn}")
+            else:
+                # Display log group name at top with white label
+                st.markdown(f'<p style="color: {TEXT_PRIMARY}; margin-bottom: 1rem;"><strong>Log Group:</strong> <code style="color: {ACCENT_BLUE};">{log_group_name}</code></p>', unsafe_allow_html=True)
 
-            if selected_arn:
+                # Auto-load logs (no button needed)
                 try:
-                    runtime_name = selected_arn.split("/")[-1]
-                    log_group_name = f"/aws/bedrock-agentcore/runtimes/{runtime_name}-DEFAULT"
-
-                    # Auto-load logs (no button needed)
-                    if True:
-                        with st.spinner("Fetching logs from CloudWatch..."):
-                            try:
-                                import boto3
-                                from datetime import datetime, timedelta
-
-                                if AWS_PROFILE:
-                                    session = boto3.Session(profile_name=AWS_PROFILE, region_name=AWS_REGION)
-                                    logs_client = session.client('logs')
-                                else:
-                                    logs_client = boto3.client('logs', region_name=AWS_REGION)
-
-                                # Get logs from last 30 minutes
-                                end_time = datetime.now()
-                                start_time = end_time - timedelta(minutes=30)
-
-                                # Get log streams
-                                streams_response = logs_client.describe_log_streams(
-                                    logGroupName=log_group_name,
-                                    orderBy='LastEventTime',
-                                    descending=True,
-                                    limit=5
-                                )
-
-                                all_logs = []
-                                for stream in streams_response.get('logStreams', []):
-                                    stream_name = stream['logStreamName']
-
-                                    # Get events from this stream
-                                    events_response = logs_client.get_log_events(
-                                        logGroupName=log_group_name,
-                                        logStreamName=stream_name,
-                                        startTime=int(start_time.timestamp() * 1000),
-                                        endTime=int(end_time.timestamp() * 1000),
-                                        limit=50
-                                    )
-
-                                    for event in events_response.get('events', []):
-                                        timestamp = datetime.fromtimestamp(event['timestamp'] / 1000)
-                                        all_logs.append({
-                                            'timestamp': timestamp,
-                                            'message': event['message']
-                                        })
-
-                                # Sort by timestamp
-                                all_logs.sort(key=lambda x: x['timestamp'], reverse=True)
-
-                                if all_logs:
-                                    st.success(f"✅ Fetched {len(all_logs)} log entries from last 30 minutes")
-
-                                    # Display logs
-                                    log_text = "\n".join([
-                                        f"[{log['timestamp'].strftime('%H:%M:%S')}] {log['message']}"
-                                        for log in all_logs[:100]  # Show last 100 entries
-                                    ])
-
-                                    st.code(log_text, language="log")
-                                else:
-                                    st.info("No logs found in the last 30 minutes")
-
-                            except Exception as e:
-                                st.error(f"❌ Error fetching logs: {e}")
+                    with st.spinner("Fetching logs from CloudWatch..."):
+                        all_logs = fetch_agent_logs(AWS_REGION, AWS_PROFILE, window_bucket)[log_group_name]
+
+                    if isinstance(all_logs, str):
+                        st.error(f"❌ Error fetching logs: {all_logs}")
+                    elif all_logs:
+                        st.success(f"✅ Fetched {len(all_logs)} log entries from last 30 minutes")
+
+                        # Display logs, formatting only the entries shown
+                        utc_offset = time.localtime().tm_gmtoff
+                        log_text = "\n".join([
+                            f"[{format_log_time(timestamp, utc_offset)}] {message}"
+                            for timestamp, message in all_logs[:LOG_DISPLAY_LIMIT]  # Show last 100 entries
+                        ])
+
+                        st.code(log_text, language="log")
+                    else:
+                        st.info("No logs found in the last 30 minutes")
 
                 except Exception as e:
-                    st.error(f"Error fetching logs: {e}")
-            else:
-                st.warning(f"ARN not configured for {selected_agent}")
+                    st.error(f"❌ Error fetching logs: {e}")
         else:
             st.info("💡 Live logs are available when using AgentCore mode")
 
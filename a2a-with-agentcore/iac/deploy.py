@@ -7,9 +7,8 @@ A2A multi-agent fitness system.
 
 import boto3
 import click
-import json
 import logging
-from datetime import datetime
+import orjson
 from boto3.session import Session
 from botocore.exceptions import ClientError
 
@@ -21,14 +20,13 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Bytes read per chunk from a streaming invocation response
+SSE_CHUNK_SIZE = 65536
 
-class DateTimeEncoder(json.JSONEncoder):
-    """JSON encoder that handles datetime objects."""
 
-    def default(self, obj):
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        return super().default(obj)
+def to_json(obj) -> str:
+    """Pretty-print a response as JSON. orjson encodes datetimes natively."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
 
 
 class AgentCoreRuntime:
@@ -46,26 +44,40 @@ class AgentCoreRuntime:
             "bedrock-agentcore-control", region_name=self.region
         )
         self.client_dp = boto3.client("bedrock-agentcore", region_name=self.region)
+        # Runtimes by name, loaded on first lookup
+        self._runtime_index: dict[str, dict] | None = None
 
     def list_runtimes(self) -> list[dict]:
-        """List all AgentCore runtimes."""
-        response = self.client_cp.list_agent_runtimes()
-        return response.get("agentRuntimes", [])
-
-    def find_runtime_by_name(self, name: str) -> dict | None:
+        """List all AgentCore runtimes, following pagination."""
+        paginator = self.client_cp.get_paginator("list_agent_runtimes")
+        return [
+            runtime
+            for page in paginator.paginate()
+            for runtime in page.get("agentRuntimes", [])
+        ]
+
+    def _index_runtimes(self, force: bool = False) -> dict[str, dict]:
+        """Build, or rebuild when forced, the runtime-by-name index."""
+        if self._runtime_index is None or force:
+            self._runtime_index = {
+                runtime["agentRuntimeName"]: runtime for runtime in self.list_runtimes()
+            }
+        return self._runtime_index
+
+    def find_runtime_by_name(self, name: str, refresh: bool = False) -> dict | None:
         """Find a runtime by name.
 
+        Lists the account's runtimes once and answers later lookups from
+        that index.
+
         Args:
             name: Runtime name to search for.
+            refresh: Re-list the runtimes before looking up.
 
         Returns:
             Runtime info dict or None if not found.
         """
-        runtimes = self.list_runtimes()
-        for runtime in runtimes:
-            if runtime.get("agentRuntimeName") == name:
-                return runtime
-        return None
+        return self._index_runtimes(force=refresh).get(name)
 
     def create_runtime(
         self,
@@ -110,11 +122,20 @@ class AgentCoreRuntime:
         try:
             response = self.client_cp.create_agent_runtime(**params)
             logger.info(f"Created runtime: {runtime_name}")
+            if self._runtime_index is not None:
+                self._runtime_index[runtime_name] = {
+                    "agentRuntimeName": runtime_name,
+                    **{k: v for k, v in response.items() if k != "ResponseMetadata"},
+                }
             return response
         except ClientError as e:
             if e.response["Error"]["Code"] == "ConflictException":
                 logger.warning(f"Runtime '{runtime_name}' already exists")
+                # Re-list only if a previously cached index predates the runtime
+                stale = self._runtime_index is not None
                 existing = self.find_runtime_by_name(runtime_name)
+                if existing is None and stale:
+                    existing = self.find_runtime_by_name(runtime_name, refresh=True)
                 if existing:
                     return existing
             raise
@@ -176,6 +197,18 @@ class AgentCoreRuntime:
         logger.info(f"Deleted runtime: {runtime_id}")
         return response
 
+    @staticmethod
+    def _collect_sse_data(line: bytes, content: list[bytes]) -> None:
+        """Append the payload of an SSE data line to content."""
+        line = line.rstrip(b"\r")
+        if line.startswith(b"data: "):
+            data = line[6:]
+            # Remove quotes if present
+            if data.startswith(b'"') and data.endswith(b'"'):
+                data = data[1:-1]
+            logger.info(data.decode("utf-8"))
+            content.append(data)
+
     def invoke(
         self,
         agent_arn: str,
@@ -192,25 +225,24 @@ class AgentCoreRuntime:
         response = self.client_dp.invoke_agent_runtime(
             agentRuntimeArn=agent_arn,
             qualifier=qualifier,
-            payload=json.dumps({"prompt": prompt}),
+            payload=orjson.dumps({"prompt": prompt}),
         )
 
         content_type = response.get("contentType", "")
 
         if "text/event-stream" in content_type:
-            # Handle SSE streaming response
+            # Handle SSE streaming response, reading in large chunks and
+            # splitting complete lines out of a byte buffer
             content = []
-            for line in response["response"].iter_lines(chunk_size=1):
-                if line:
-                    line = line.decode("utf-8")
-                    if line.startswith("data: "):
-                        data = line[6:]
-                        # Remove quotes if present
-                        if data.startswith('"') and data.endswith('"'):
-                            data = data[1:-1]
-                        logger.info(data)
-                        content.append(data)
-            print("".join(content))
+            buf = bytearray()
+            for chunk in response["response"].iter_chunks(chunk_size=SSE_CHUNK_SIZE):
+                buf.extend(chunk)
+                while (nl := buf.find(b"\n")) >= 0:
+                    self._collect_sse_data(bytes(buf[:nl]), content)
+                    del buf[:nl + 1]
+            if buf:
+                self._collect_sse_data(bytes(buf), content)
+            print(b"".join(content).decode("utf-8"))
         else:
             # Handle JSON response
             try:
@@ -218,94 +250,116 @@ class AgentCoreRuntime:
                 for event in response.get("response", []):
                     events.append(event)
                 if events:
-                    result = json.loads(events[0].decode("utf-8"))
-                    print(json.dumps(result, indent=2))
+                    result = orjson.loads(events[0])
+                    print(to_json(result))
             except Exception as e:
                 logger.error(f"Error reading response: {e}")
 
 
-@click.command()
-@click.option("--action", required=True, help="Action: create, update, delete, list, invoke")
-@click.option("--runtime-name", help="Runtime name (for create)")
-@click.option("--runtime-id", help="Runtime ID (for update/delete)")
-@click.option("--ecr-repo-uri", help="ECR repository URI")
-@click.option("--execution-role", help="IAM execution role ARN")
-@click.option("--server-protocol", default="HTTP", help="Server protocol (HTTP/MCP)")
-@click.option("--env-vars", help="Environment variables as JSON")
-@click.option("--authorizer-configuration", help="Authorizer config as JSON")
-@click.option("--agent-arn", help="Agent ARN (for invoke)")
-@click.option("--agent-version", default="DEFAULT", help="Agent version (for invoke)")
-@click.option("--prompt", help="Prompt to send (for invoke)")
-def main(
-    action: str,
-    runtime_name: str | None,
-    runtime_id: str | None,
-    ecr_repo_uri: str | None,
-    execution_role: str | None,
+class JsonParamType(click.ParamType):
+    """Click parameter that decodes a JSON string at parse time."""
+
+    name = "json"
+
+    def convert(self, value, param, ctx):
+        if not isinstance(value, str):
+            return value
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError as e:
+            self.fail(f"invalid JSON: {e}", param, ctx)
+
+
+JSON = JsonParamType()
+
+
+def runtime_options(func):
+    """Options shared by the create and update commands."""
+    options = [
+        click.option("--ecr-repo-uri", required=True, help="ECR repository URI"),
+        click.option("--execution-role", required=True, help="IAM execution role ARN"),
+        click.option("--server-protocol", default="HTTP", help="Server protocol (HTTP/MCP)"),
+        click.option("--env-vars", type=JSON, help="Environment variables as JSON"),
+        click.option("--authorizer-configuration", type=JSON, help="Authorizer config as JSON"),
+    ]
+    for option in reversed(options):
+        func = option(func)
+    return func
+
+
+@click.group()
+def cli():
+    """AgentCore Runtime Management CLI."""
+
+
+@cli.command("create")
+@click.option("--runtime-name", required=True, help="Runtime name")
+@runtime_options
+def create(
+    runtime_name: str,
+    ecr_repo_uri: str,
+    execution_role: str,
     server_protocol: str,
-    env_vars: str | None,
-    authorizer_configuration: str | None,
-    agent_arn: str | None,
-    agent_version: str,
-    prompt: str | None,
+    env_vars: dict | None,
+    authorizer_configuration: dict | None,
 ):
-    """AgentCore Runtime Management CLI."""
-    runtime = AgentCoreRuntime()
+    """Create an agent runtime."""
+    response = AgentCoreRuntime().create_runtime(
+        runtime_name,
+        ecr_repo_uri,
+        execution_role,
+        server_protocol,
+        env_vars,
+        authorizer_configuration,
+    )
+    print(to_json(response))
 
-    # Parse JSON options
-    parsed_env_vars = json.loads(env_vars) if env_vars else None
-    parsed_auth_config = (
-        json.loads(authorizer_configuration) if authorizer_configuration else None
+
+@cli.command("update")
+@click.option("--runtime-id", required=True, help="Runtime ID")
+@runtime_options
+def update(
+    runtime_id: str,
+    ecr_repo_uri: str,
+    execution_role: str,
+    server_protocol: str,
+    env_vars: dict | None,
+    authorizer_configuration: dict | None,
+):
+    """Update an agent runtime."""
+    response = AgentCoreRuntime().update_runtime(
+        runtime_id,
+        ecr_repo_uri,
+        execution_role,
+        server_protocol,
+        env_vars,
+        authorizer_configuration,
     )
+    print(to_json(response))
 
-    if action == "create":
-        if not all([runtime_name, ecr_repo_uri, execution_role]):
-            raise click.UsageError(
-                "create requires --runtime-name, --ecr-repo-uri, --execution-role"
-            )
-        response = runtime.create_runtime(
-            runtime_name,
-            ecr_repo_uri,
-            execution_role,
-            server_protocol,
-            parsed_env_vars,
-            parsed_auth_config,
-        )
-        print(json.dumps(response, indent=2, cls=DateTimeEncoder))
-
-    elif action == "update":
-        if not all([runtime_id, ecr_repo_uri, execution_role]):
-            raise click.UsageError(
-                "update requires --runtime-id, --ecr-repo-uri, --execution-role"
-            )
-        response = runtime.update_runtime(
-            runtime_id,
-            ecr_repo_uri,
-            execution_role,
-            server_protocol,
-            parsed_env_vars,
-            parsed_auth_config,
-        )
-        print(json.dumps(response, indent=2, cls=DateTimeEncoder))
 
-    elif action == "delete":
-        if not runtime_id:
-            raise click.UsageError("delete requires --runtime-id")
-        response = runtime.delete_runtime(runtime_id)
-        print(json.dumps(response, indent=2, cls=DateTimeEncoder))
+@cli.command("delete")
+@click.option("--runtime-id", required=True, help="Runtime ID")
+def delete(runtime_id: str):
+    """Delete an agent runtime."""
+    response = AgentCoreRuntime().delete_runtime(runtime_id)
+    print(to_json(response))
+
 
-    elif action == "list":
-        runtimes = runtime.list_runtimes()
-        print(json.dumps(runtimes, indent=2, cls=DateTimeEncoder))
+@cli.command("list")
+def list_command():
+    """List agent runtimes."""
+    print(to_json(AgentCoreRuntime().list_runtimes()))
 
-    elif action == "invoke":
-        if not all([agent_arn, prompt]):
-            raise click.UsageError("invoke requires --agent-arn, --prompt")
-        runtime.invoke(agent_arn, prompt, agent_version)
 
-    else:
-        raise click.UsageError(f"Unknown action: {action}")
+@cli.command("invoke")
+@click.option("--agent-arn", required=True, help="Agent ARN")
+@click.option("--prompt", required=True, help="Prompt to send")
+@click.option("--agent-version", default="DEFAULT", help="Agent version")
+def invoke(agent_arn: str, prompt: str, agent_version: str):
+    """Invoke an agent runtime."""
+    AgentCoreRuntime().invoke(agent_arn, prompt, agent_version)
 
 
 if __name__ == "__main__":
-    main()
+    cli()
@@ -11,7 +11,7 @@ Usage:
     make local.compose.down
 """
 
-import json
+import asyncio
 import os
 import sys
 import time
@@ -19,6 +19,7 @@ import unittest
 from typing import Any
 
 import httpx
+import orjson
 
 # Agent URLs (local development)
 ORCHESTRATOR_URL = os.environ.get("ORCHESTRATOR_URL", "http://localhost:8081")
@@ -28,8 +29,16 @@ LIFESYNC_URL = os.environ.get("LIFESYNC_URL", "http://localhost:8083")
 TIMEOUT = 60.0  # Timeout for agent responses
 
 
-def wait_for_agents(timeout: float = 30.0) -> bool:
-    """Wait for all agents to be healthy."""
+async def _check_health(client: httpx.AsyncClient, url: str) -> bool:
+    """Return True if the agent at url answers its health check."""
+    try:
+        response = await client.get(f"{url}/health", timeout=5.0)
+        return response.status_code == 200
+    except Exception:
+        return False
+
+
+async def _wait_for_agents(timeout: float) -> bool:
     start_time = time.time()
     agents = [
         (ORCHESTRATOR_URL, "Orchestrator"),
@@ -37,27 +46,30 @@ def wait_for_agents(timeout: float = 30.0) -> bool:
         (LIFESYNC_URL, "Life Sync"),
     ]
 
-    while time.time() - start_time < timeout:
-        all_healthy = True
-        for url, name in agents:
-            try:
-                response = httpx.get(f"{url}/health", timeout=5.0)
-                if response.status_code != 200:
-                    all_healthy = False
+    # One client for every round so connections are pooled between polls
+    async with httpx.AsyncClient() as client:
+        while time.time() - start_time < timeout:
+            results = await asyncio.gather(
+                *(_check_health(client, url) for url, _ in agents)
+            )
+            if all(results):
+                print("All agents are healthy!")
+                return True
+
+            for (_, name), healthy in zip(agents, results):
+                if not healthy:
                     print(f"Waiting for {name}...")
-            except Exception:
-                all_healthy = False
-                print(f"Waiting for {name}...")
-
-        if all_healthy:
-            print("All agents are healthy!")
-            return True
 
-        time.sleep(2)
+            await asyncio.sleep(2)
 
     return False
 
 
+def wait_for_agents(timeout: float = 30.0) -> bool:
+    """Wait for all agents to be healthy, checking them concurrently."""
+    return asyncio.run(_wait_for_agents(timeout))
+
+
 def send_a2a_task(url: str, task_id: str, message_text: str) -> dict[str, Any]:
     """Send an A2A task to an agent at root endpoint."""
     request = {
@@ -235,9 +247,16 @@ class TestA2AStreaming(unittest.TestCase):
             json=request,
             timeout=TIMEOUT,
         ) as response:
-            for line in response.iter_lines():
-                if line.startswith("data:"):
-                    events.append(json.loads(line[5:]))
+            buffer = bytearray()
+            for chunk in response.iter_bytes():
+                buffer.extend(chunk)
+                # SSE events are separated by a blank line
+                while (boundary := buffer.find(b"\n\n")) >= 0:
+                    frame = bytes(buffer[:boundary])
+                    del buffer[:boundary + 2]
+                    for line in frame.split(b"\n"):
+                        if line.startswith(b"data:"):
+                            events.append(orjson.loads(line[5:].lstrip()))
 
         # Should have at least status and result events
         self.assertGreater(len(events), 0)
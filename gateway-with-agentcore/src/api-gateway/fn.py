@@ -1,32 +1,40 @@
 import boto3
 import json
+import logging
+import os
 import random
 
 # initialization
 session = boto3.session.Session()
 client = session.client('bedrock-agentcore')
+logger = logging.getLogger()
+logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
+HEADERS = {
+    "Content-Type": "application/json"
+}
+
+# mock users, generated once per container with unique ids
+USERS = [
+    {
+        "name": f"user@{i}",
+        "email": f"user.{i}@example.com"
+    } for i in random.Random().sample(range(100, 1000), 5)
+]
+USERS_BODY = json.dumps(USERS)
 
 # helper functions
 def build_response(code, body):
-    headers = {
-        "Content-Type": "application/json"
-    }
     response = {
         "isBase64Encoded": False,
         "statusCode": code,
-        "headers": headers,
+        "headers": HEADERS,
         "body": body
     }
     return response
 
 def handler(event, context):
-    output = build_response(200, json.dumps(event))
-    users = [
-        {
-            "name": f"user@{i}",
-            "email": f"user.{i}@example.com"
-        } for i in [random.randint(100, 999) for _ in range(5)]
-    ]
-    output = build_response(200, json.dumps(users))
-    print(json.dumps(output))
-    return output
+    # the event is only serialized when debug logging is on
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("event=%s", json.dumps(event))
+    logger.info("users_returned count=%d", len(USERS))
+    return build_response(200, USERS_BODY)
@@ -1,31 +1,37 @@
 import json
+import logging
 import os
 
+# initialization
+logger = logging.getLogger()
+logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
+_EMPTY = {}
+_MISSING = object()
+POLICY_VERSION = "2012-10-17"
+INVOKE_ACTION = "execute-api:Invoke"
+
 def extract_token(event):
-    if "Authorization" in event["headers"]:
-        token = event["headers"]["Authorization"]
-    elif "authorization" in event["headers"]:
-        token = event["headers"]["authorization"]
-    else:
-        token = "deny"
+    headers = event.get("headers", _EMPTY)
+    token = headers.get("Authorization", _MISSING)
+    if token is _MISSING:
+        token = headers.get("authorization", "deny")
     return token
 
 def extract_user(event):
-    if "requestContext" in event and "identity" in event["requestContext"] and "user" in event["requestContext"]["identity"]:
-        if event["requestContext"]["identity"]["user"] is not None:
-            user = event["requestContext"]["identity"]["user"]
-        else:
-            user = "unidentified_user"
-    else:
-        user = "invalid_request"
+    user = event.get("requestContext", _EMPTY).get("identity", _EMPTY).get("user", _MISSING)
+    if user is _MISSING:
+        return "invalid_request"
+    if user is None:
+        return "unidentified_user"
     return user
 
 def extract_method_context(event):
-    if "methodArn" in event:
-        resource = event["methodArn"]
+    method_arn = event.get("methodArn")
+    if method_arn is not None:
+        resource = method_arn
         payload_version = "1.0"
         is_simple = "false"
-    elif "routeArn" in event:
+    else:
         resource = "{}/*".format(event["routeArn"])
         payload_version = event["version"]
         is_simple = os.environ.get("SET_SIMPLE", "false")
@@ -41,21 +47,21 @@ def generate_policy(principal, effect, resource, context):
         "context": context
     }
     if effect and resource:
-        policy = {
-            "Version": "2012-10-17",
-            "Statement": [
-                {
-                    "Effect": effect,
-                    "Action": "execute-api:Invoke",
-                    "Resource": [resource]
-                }
-            ]
+        response["policyDocument"] = {
+            "Version": POLICY_VERSION,
+            "Statement": ({
+                "Effect": effect,
+                "Action": INVOKE_ACTION,
+                "Resource": (resource,)
+            },)
         }
-        response["policyDocument"] = policy
     return response
 
 def handler(event, context):
-    print(json.dumps(event))
+    # the event and policy are only serialized when debug logging is on
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug("event=%s", json.dumps(event))
     token = extract_token(event)
     user = extract_user(event)
     resource, context = extract_method_context(event)
@@ -66,6 +72,7 @@ def handler(event, context):
         response = generate_policy(user, "Deny", resource, context)
     else:
         raise Exception("invalid_request")
-    print(json.dumps(response))
+    if debug:
+        logger.debug("response=%s", json.dumps(response))
     return response
 